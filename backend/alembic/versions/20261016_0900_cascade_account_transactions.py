@@ -0,0 +1,70 @@
+"""cascade transaction deletes from accounts and null dangling transfer links
+
+Revision ID: 20261016_0900
+Revises: 20260206_1520
+Create Date: 2026-10-16 09:00:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_0900'
+down_revision = '20260206_1520'
+branch_labels = None
+depends_on = None
+
+# SQLite foreign keys created by create_all() are unnamed; give the reflected
+# ones predictable names so batch mode can drop and recreate them.
+naming_convention = {
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+}
+
+
+def upgrade() -> None:
+    with op.batch_alter_table(
+        'transactions', naming_convention=naming_convention, recreate='always'
+    ) as batch_op:
+        batch_op.drop_constraint(
+            'fk_transactions_account_id_accounts', type_='foreignkey'
+        )
+        batch_op.drop_constraint(
+            'fk_transactions_transfer_link_id_transactions', type_='foreignkey'
+        )
+        batch_op.create_foreign_key(
+            'fk_transactions_account_id_accounts',
+            'accounts',
+            ['account_id'],
+            ['id'],
+            ondelete='CASCADE'
+        )
+        batch_op.create_foreign_key(
+            'fk_transactions_transfer_link_id_transactions',
+            'transactions',
+            ['transfer_link_id'],
+            ['id'],
+            ondelete='SET NULL'
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table(
+        'transactions', naming_convention=naming_convention, recreate='always'
+    ) as batch_op:
+        batch_op.drop_constraint(
+            'fk_transactions_account_id_accounts', type_='foreignkey'
+        )
+        batch_op.drop_constraint(
+            'fk_transactions_transfer_link_id_transactions', type_='foreignkey'
+        )
+        batch_op.create_foreign_key(
+            'fk_transactions_account_id_accounts',
+            'accounts',
+            ['account_id'],
+            ['id']
+        )
+        batch_op.create_foreign_key(
+            'fk_transactions_transfer_link_id_transactions',
+            'transactions',
+            ['transfer_link_id'],
+            ['id']
+        )
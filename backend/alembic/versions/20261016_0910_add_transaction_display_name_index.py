@@ -0,0 +1,27 @@
+"""add composite index for latest transaction by display name
+
+Revision ID: 20261016_0910
+Revises: 20261016_0900
+Create Date: 2026-10-16 09:10:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_0910'
+down_revision = '20261016_0900'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tx_displayname_date',
+        'transactions',
+        ['display_name', sa.text('posted_date DESC'), sa.text('created_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tx_displayname_date', table_name='transactions')
@@ -0,0 +1,22 @@
+"""index transactions.payee_raw for distinct payee lookups
+
+Revision ID: 20261016_0920
+Revises: 20261016_0910
+Create Date: 2026-10-16 09:20:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_0920'
+down_revision = '20261016_0910'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_transactions_payee_raw', 'transactions', ['payee_raw'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_payee_raw', table_name='transactions')
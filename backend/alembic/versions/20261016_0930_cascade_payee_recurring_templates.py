@@ -0,0 +1,51 @@
+"""cascade recurring template deletes from payees
+
+Revision ID: 20261016_0930
+Revises: 20261016_0920
+Create Date: 2026-10-16 09:30:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_0930'
+down_revision = '20261016_0920'
+branch_labels = None
+depends_on = None
+
+# SQLite foreign keys created by create_all() are unnamed; give the reflected
+# ones predictable names so batch mode can drop and recreate them.
+naming_convention = {
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+}
+
+
+def upgrade() -> None:
+    with op.batch_alter_table(
+        'recurring_templates', naming_convention=naming_convention, recreate='always'
+    ) as batch_op:
+        batch_op.drop_constraint(
+            'fk_recurring_templates_payee_id_payees', type_='foreignkey'
+        )
+        batch_op.create_foreign_key(
+            'fk_recurring_templates_payee_id_payees',
+            'payees',
+            ['payee_id'],
+            ['id'],
+            ondelete='CASCADE'
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table(
+        'recurring_templates', naming_convention=naming_convention, recreate='always'
+    ) as batch_op:
+        batch_op.drop_constraint(
+            'fk_recurring_templates_payee_id_payees', type_='foreignkey'
+        )
+        batch_op.create_foreign_key(
+            'fk_recurring_templates_payee_id_payees',
+            'payees',
+            ['payee_id'],
+            ['id']
+        )
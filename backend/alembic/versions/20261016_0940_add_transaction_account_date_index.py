@@ -0,0 +1,24 @@
+"""add composite index on transactions (account_id, posted_date)
+
+Revision ID: 20261016_0940
+Revises: 20261016_0930
+Create Date: 2026-10-16 09:40:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_0940'
+down_revision = '20261016_0930'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tx_account_date', 'transactions', ['account_id', 'posted_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tx_account_date', table_name='transactions')
@@ -0,0 +1,60 @@
+"""add FTS5 trigram index for transaction payee search
+
+Revision ID: 20261016_0950
+Revises: 20261016_0940
+Create Date: 2026-10-16 09:50:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_0950'
+down_revision = '20261016_0940'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE tx_payee_fts USING fts5(
+            payee_raw, payee_normalized, display_name,
+            content='transactions', content_rowid='id', tokenize='trigram'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tx_payee_fts_ai AFTER INSERT ON transactions BEGIN
+            INSERT INTO tx_payee_fts(rowid, payee_raw, payee_normalized, display_name)
+            VALUES (new.id, new.payee_raw, new.payee_normalized, new.display_name);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tx_payee_fts_ad AFTER DELETE ON transactions BEGIN
+            INSERT INTO tx_payee_fts(tx_payee_fts, rowid, payee_raw, payee_normalized, display_name)
+            VALUES ('delete', old.id, old.payee_raw, old.payee_normalized, old.display_name);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tx_payee_fts_au
+        AFTER UPDATE OF payee_raw, payee_normalized, display_name ON transactions BEGIN
+            INSERT INTO tx_payee_fts(tx_payee_fts, rowid, payee_raw, payee_normalized, display_name)
+            VALUES ('delete', old.id, old.payee_raw, old.payee_normalized, old.display_name);
+            INSERT INTO tx_payee_fts(rowid, payee_raw, payee_normalized, display_name)
+            VALUES (new.id, new.payee_raw, new.payee_normalized, new.display_name);
+        END
+        """
+    )
+    op.execute("INSERT INTO tx_payee_fts(tx_payee_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS tx_payee_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS tx_payee_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS tx_payee_fts_ai")
+    op.execute("DROP TABLE IF EXISTS tx_payee_fts")
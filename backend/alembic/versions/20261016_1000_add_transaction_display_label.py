@@ -0,0 +1,40 @@
+"""add generated display_label column to transactions
+
+Revision ID: 20261016_1000
+Revises: 20261016_0950
+Create Date: 2026-10-16 10:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1000'
+down_revision = '20261016_0950'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # VIRTUAL generated columns can be added in place on SQLite and need no backfill
+    op.add_column(
+        'transactions',
+        sa.Column(
+            'display_label',
+            sa.String(500),
+            sa.Computed(
+                'coalesce(display_name, payee_normalized, payee_raw)',
+                persisted=False,
+            ),
+        ),
+    )
+    op.create_index(
+        'ix_transactions_display_label', 'transactions', ['display_label']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_display_label', table_name='transactions')
+    # Drop in place (SQLite 3.35+) rather than via a batch rebuild, which
+    # would copy generated columns as plain ones and lose the table's triggers
+    op.drop_column('transactions', 'display_label')
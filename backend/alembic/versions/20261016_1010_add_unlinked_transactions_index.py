@@ -0,0 +1,28 @@
+"""add partial index on unlinked transactions for transfer matching
+
+Revision ID: 20261016_1010
+Revises: 20261016_1000
+Create Date: 2026-10-16 10:10:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1010'
+down_revision = '20261016_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tx_unlinked', 'transactions', ['account_id', 'posted_date'],
+        sqlite_where=sa.text(
+            "transfer_link_id IS NULL AND transaction_type != 'TRANSFER'"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tx_unlinked', table_name='transactions')
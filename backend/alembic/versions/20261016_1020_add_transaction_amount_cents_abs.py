@@ -0,0 +1,38 @@
+"""add generated amount_cents_abs column to transactions
+
+Revision ID: 20261016_1020
+Revises: 20261016_1010
+Create Date: 2026-10-16 10:20:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1020'
+down_revision = '20261016_1010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLite cannot ADD a STORED generated column, but a VIRTUAL one indexes the same
+    op.add_column(
+        'transactions',
+        sa.Column(
+            'amount_cents_abs',
+            sa.Integer(),
+            sa.Computed('abs(amount_cents)', persisted=False),
+        ),
+    )
+    op.create_index(
+        'ix_tx_abs', 'transactions',
+        ['account_id', 'amount_cents_abs', 'posted_date'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tx_abs', table_name='transactions')
+    # Drop in place (SQLite 3.35+) rather than via a batch rebuild, which
+    # would copy generated columns as plain ones and lose the table's triggers
+    op.drop_column('transactions', 'amount_cents_abs')
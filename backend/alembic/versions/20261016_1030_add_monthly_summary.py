@@ -0,0 +1,116 @@
+"""add trigger-maintained monthly_summary table for reports
+
+Revision ID: 20261016_1030
+Revises: 20261016_1020
+Create Date: 2026-10-16 10:30:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1030'
+down_revision = '20261016_1020'
+branch_labels = None
+depends_on = None
+
+TRANSACTION_TYPES = ('ACTUAL', 'FORECAST', 'BALANCE_ADJUSTMENT', 'TRANSFER')
+
+DELTA = """
+        INSERT INTO monthly_summary (
+            account_id, year, month, category_id, payee_label, transaction_type,
+            income_cents, expense_cents, transaction_count
+        )
+        SELECT
+            {row}.account_id,
+            CAST(strftime('%Y', {row}.posted_date) AS INTEGER),
+            CAST(strftime('%m', {row}.posted_date) AS INTEGER),
+            coalesce({row}.category_id, 0),
+            coalesce({row}.display_name, {row}.payee_normalized, {row}.payee_raw, 'Unknown'),
+            {row}.transaction_type,
+            {sign}max({row}.amount_cents, 0),
+            {sign}max(-{row}.amount_cents, 0),
+            {sign}1
+        WHERE {row}.transaction_type IN ('ACTUAL', 'TRANSFER')
+        ON CONFLICT (account_id, year, month, category_id, payee_label, transaction_type)
+        DO UPDATE SET
+            income_cents = income_cents + excluded.income_cents,
+            expense_cents = expense_cents + excluded.expense_cents,
+            transaction_count = transaction_count + excluded.transaction_count;
+"""
+
+PRUNE = """
+        DELETE FROM monthly_summary
+        WHERE account_id = old.account_id AND transaction_count = 0;
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'monthly_summary',
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('year', sa.Integer(), nullable=False),
+        sa.Column('month', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('payee_label', sa.String(500), nullable=False),
+        sa.Column(
+            'transaction_type',
+            sa.Enum(*TRANSACTION_TYPES, name='transactiontype'),
+            nullable=False,
+        ),
+        sa.Column('income_cents', sa.Integer(), nullable=False),
+        sa.Column('expense_cents', sa.Integer(), nullable=False),
+        sa.Column('transaction_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            'account_id', 'year', 'month', 'category_id', 'payee_label',
+            'transaction_type',
+        ),
+    )
+    op.execute(
+        "CREATE TRIGGER monthly_summary_ai AFTER INSERT ON transactions BEGIN"
+        + DELTA.format(row='new', sign='')
+        + "END"
+    )
+    op.execute(
+        "CREATE TRIGGER monthly_summary_ad AFTER DELETE ON transactions BEGIN"
+        + DELTA.format(row='old', sign='-')
+        + PRUNE
+        + "END"
+    )
+    op.execute(
+        "CREATE TRIGGER monthly_summary_au AFTER UPDATE OF account_id, posted_date, "
+        "amount_cents, category_id, payee_raw, payee_normalized, display_name, "
+        "transaction_type ON transactions BEGIN"
+        + DELTA.format(row='old', sign='-')
+        + DELTA.format(row='new', sign='')
+        + PRUNE
+        + "END"
+    )
+    op.execute(
+        """
+        INSERT INTO monthly_summary (
+            account_id, year, month, category_id, payee_label, transaction_type,
+            income_cents, expense_cents, transaction_count
+        )
+        SELECT
+            account_id,
+            CAST(strftime('%Y', posted_date) AS INTEGER),
+            CAST(strftime('%m', posted_date) AS INTEGER),
+            coalesce(category_id, 0),
+            coalesce(display_name, payee_normalized, payee_raw, 'Unknown'),
+            transaction_type,
+            sum(max(amount_cents, 0)),
+            sum(max(-amount_cents, 0)),
+            count(*)
+        FROM transactions
+        WHERE transaction_type IN ('ACTUAL', 'TRANSFER')
+        GROUP BY 1, 2, 3, 4, 5, 6
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS monthly_summary_au")
+    op.execute("DROP TRIGGER IF EXISTS monthly_summary_ad")
+    op.execute("DROP TRIGGER IF EXISTS monthly_summary_ai")
+    op.drop_table('monthly_summary')
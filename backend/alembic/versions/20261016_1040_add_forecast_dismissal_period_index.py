@@ -0,0 +1,26 @@
+"""add index on forecast_dismissals.period_date
+
+Revision ID: 20261016_1040
+Revises: 20261016_1030
+Create Date: 2026-10-16 10:40:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1040'
+down_revision = '20261016_1030'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_forecast_dismissals_period_date', 'forecast_dismissals', ['period_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_forecast_dismissals_period_date', table_name='forecast_dismissals'
+    )
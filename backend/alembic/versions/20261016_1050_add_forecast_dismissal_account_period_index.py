@@ -0,0 +1,27 @@
+"""add (account_id, period_date) index on forecast_dismissals
+
+Revision ID: 20261016_1050
+Revises: 20261016_1040
+Create Date: 2026-10-16 10:50:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1050'
+down_revision = '20261016_1040'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_forecast_dismissals_account_period', 'forecast_dismissals',
+        ['account_id', 'period_date'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_forecast_dismissals_account_period', table_name='forecast_dismissals'
+    )
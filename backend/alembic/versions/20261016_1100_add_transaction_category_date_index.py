@@ -0,0 +1,31 @@
+"""add (category_id, posted_date) index on transactions, drop account_id index
+
+ix_tx_account_date leads with account_id, so the single-column index is
+redundant and only adds work on every insert.
+
+Revision ID: 20261016_1100
+Revises: 20261016_1050
+Create Date: 2026-10-16 11:00:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1100'
+down_revision = '20261016_1050'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tx_category_date', 'transactions', ['category_id', 'posted_date']
+    )
+    op.execute("DROP INDEX IF EXISTS ix_transactions_account_id")
+    # Refresh planner statistics so the new index is costed correctly
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    op.create_index('ix_transactions_account_id', 'transactions', ['account_id'])
+    op.drop_index('ix_tx_category_date', table_name='transactions')
@@ -0,0 +1,47 @@
+"""cascade account deletes to budget scoping, dismissals, profiles and rules
+
+Revision ID: 20261016_1110
+Revises: 20261016_1100
+Create Date: 2026-10-16 11:10:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_1110'
+down_revision = '20261016_1100'
+branch_labels = None
+depends_on = None
+
+# SQLite foreign keys created by create_all() are unnamed; give the reflected
+# ones predictable names so batch mode can drop and recreate them.
+naming_convention = {
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+}
+
+TABLES = (
+    'budget_accounts',
+    'forecast_dismissals',
+    'import_profiles',
+    'categorization_rules',
+)
+
+
+def _set_account_fk(ondelete: str | None) -> None:
+    for table in TABLES:
+        name = f'fk_{table}_account_id_accounts'
+        with op.batch_alter_table(
+            table, naming_convention=naming_convention, recreate='always'
+        ) as batch_op:
+            batch_op.drop_constraint(name, type_='foreignkey')
+            batch_op.create_foreign_key(
+                name, 'accounts', ['account_id'], ['id'], ondelete=ondelete
+            )
+
+
+def upgrade() -> None:
+    _set_account_fk('CASCADE')
+
+
+def downgrade() -> None:
+    _set_account_fk(None)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from .books import router as books_router
 from .accounts import router as accounts_router
@@ -10,7 +11,7 @@ from .reports import router as reports_router
 from .forecasts import router as forecasts_router
 from .budgets import router as budgets_router
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 api_router.include_router(books_router, prefix="/books", tags=["books"])
 api_router.include_router(accounts_router, prefix="/accounts", tags=["accounts"])
@@ -1,46 +1,61 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_db
-from ..models import Account, Transaction
+from ..database import get_async_db
+from ..models import Account
 from ..schemas import AccountCreate, AccountUpdate, AccountResponse
 
 router = APIRouter()
 
+_LIST_CHUNK_SIZE = 500
+
+# Primary-key lookup shared by the single-account endpoints. lambda_stmt caches
+# the compiled SQL so it isn't rebuilt on every request.
+_GET_ACCOUNT = lambda_stmt(
+    lambda: select(Account).where(Account.id == bindparam("account_id"))
+)
+
 
 @router.get("/", response_model=list[AccountResponse])
-def list_accounts(db: Session = Depends(get_db)):
+async def list_accounts(db: AsyncSession = Depends(get_async_db)):
     """Get all accounts."""
-    return db.query(Account).order_by(Account.display_order, Account.name).all()
+    # Fetch in chunks and convert as rows arrive so ORM instances don't all
+    # have to be alive at once
+    result = await db.stream_scalars(
+        select(Account)
+        .order_by(Account.display_order, Account.name)
+        .execution_options(yield_per=_LIST_CHUNK_SIZE)
+    )
+    return [AccountResponse.from_orm_fast(a) async for a in result]
 
 
 @router.get("/{account_id}", response_model=AccountResponse)
-def get_account(account_id: int, db: Session = Depends(get_db)):
+async def get_account(account_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a single account by ID."""
-    account = db.query(Account).filter(Account.id == account_id).first()
+    account = await db.scalar(_GET_ACCOUNT, {"account_id": account_id})
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     return account
 
 
 @router.post("/", response_model=AccountResponse, status_code=201)
-def create_account(account: AccountCreate, db: Session = Depends(get_db)):
+async def create_account(account: AccountCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new account."""
     db_account = Account(**account.model_dump())
     db.add(db_account)
-    db.flush()
-    db.refresh(db_account)
+    await db.flush()
     return db_account
 
 
 @router.patch("/{account_id}", response_model=AccountResponse)
-def update_account(
+async def update_account(
     account_id: int,
     account: AccountUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an account."""
-    db_account = db.query(Account).filter(Account.id == account_id).first()
+    db_account = await db.scalar(_GET_ACCOUNT, {"account_id": account_id})
     if not db_account:
         raise HTTPException(status_code=404, detail="Account not found")
 
@@ -48,36 +63,19 @@ def update_account(
     for field, value in update_data.items():
         setattr(db_account, field, value)
 
-    db.flush()
-    db.refresh(db_account)
+    await db.flush()
     return db_account
 
 
 @router.delete("/{account_id}", status_code=204)
-def delete_account(account_id: int, db: Session = Depends(get_db)):
+async def delete_account(account_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete an account and all its transactions."""
-    db_account = db.query(Account).filter(Account.id == account_id).first()
+    db_account = await db.scalar(_GET_ACCOUNT, {"account_id": account_id})
     if not db_account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    # Break transfer links to avoid circular FK constraint failures
-    db.query(Transaction).filter(
-        Transaction.account_id == account_id,
-        Transaction.transfer_link_id.isnot(None)
-    ).update({Transaction.transfer_link_id: None}, synchronize_session=False)
-
-    # Also break links FROM other accounts pointing TO transactions in this account
-    tx_ids = [t.id for t in db.query(Transaction.id).filter(Transaction.account_id == account_id).all()]
-    if tx_ids:
-        db.query(Transaction).filter(
-            Transaction.transfer_link_id.in_(tx_ids)
-        ).update({Transaction.transfer_link_id: None}, synchronize_session=False)
-
-    db.flush()
-
-    # Now delete all transactions in this account
-    db.query(Transaction).filter(Transaction.account_id == account_id).delete(synchronize_session=False)
-    db.flush()
-
-    db.delete(db_account)
+    # Transactions, import profiles, budget scoping, forecast dismissals and
+    # account-specific rules go with the account via ON DELETE CASCADE, and
+    # transfer links pointing at its transactions are cleared by SET NULL.
+    await db.delete(db_account)
     return None
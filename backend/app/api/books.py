@@ -1,18 +1,38 @@
+import asyncio
+import logging
+import os
 import shutil
 import sqlite3
 import tempfile
+import threading
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, Query, UploadFile, File
-from fastapi.responses import FileResponse
+import orjson
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, UploadFile, File
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import lambda_stmt, select
 from starlette.background import BackgroundTask
 
 from ..config import load_recent_books, add_recent_book, update_backup_timestamp, get_backup_status, rename_book, get_book_name, RecentBook
-from ..database import open_book, close_book, is_book_open, get_current_book_path, check_book_has_password, verify_book_password, hash_password, verify_password, get_db
+from ..database import open_book, close_book, is_book_open, get_current_book_path, check_book_has_password, verify_book_password, hash_password, verify_password, get_async_session, invalidate_password_cache
 from ..models import BookSettings
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Short-lived cache for the filesystem listings the UI polls. Entries expire
+# after a couple of seconds and are dropped whenever the recent list changes.
+_listing_cache: TTLCache = TTLCache(maxsize=64, ttl=2)
+_listing_cache_lock = threading.Lock()
+
+
+def _invalidate_listings() -> None:
+    with _listing_cache_lock:
+        _listing_cache.clear()
 
 
 class BookPath(BaseModel):
@@ -30,12 +50,27 @@ class BookStatus(BaseModel):
     has_password: bool = False
 
 
+_RECENT_KEY = hashkey("recent")
+
+
 @router.get("/recent", response_model=list[RecentBook])
-def get_recent_books():
+async def get_recent_books():
     """Get list of recently opened books."""
-    books = load_recent_books()
-    # Filter out non-existent files
-    return [b for b in books if Path(b.path).exists()]
+    with _listing_cache_lock:
+        cached_books = _listing_cache.get(_RECENT_KEY)
+    if cached_books is not None:
+        return cached_books
+
+    books = await asyncio.to_thread(load_recent_books)
+    # Filter out non-existent files, stat'ing them concurrently
+    exists = await asyncio.gather(
+        *(asyncio.to_thread(os.path.exists, b.path) for b in books)
+    )
+    books = [b for b, ok in zip(books, exists) if ok]
+
+    with _listing_cache_lock:
+        _listing_cache[_RECENT_KEY] = books
+    return books
 
 
 @router.get("/status", response_model=BookStatus)
@@ -72,6 +107,7 @@ def open_existing_book(book: BookPath):
     try:
         open_book(path)
         add_recent_book(path, book.name)
+        _invalidate_listings()
         return BookStatus(
             is_open=True,
             path=str(path),
@@ -95,6 +131,7 @@ def create_new_book(book: BookPath):
     try:
         open_book(path)
         add_recent_book(path, book.name)
+        _invalidate_listings()
         return BookStatus(
             is_open=True,
             path=str(path),
@@ -110,6 +147,33 @@ class BrowseEntry(BaseModel):
     is_dir: bool
 
 
+_BOOK_SUFFIXES = {'db', 'sqlite', 'sqlite3'}
+
+
+@cached(_listing_cache, key=partial(hashkey, "browse"), lock=_listing_cache_lock)
+def _list_directory(target: Path) -> bytes:
+    """Return the JSON-encoded listing of a directory (see BrowseEntry)."""
+    # scandir's DirEntry caches the type from the directory read, so there is
+    # no extra stat() per entry
+    with os.scandir(target) as it:
+        visible = [
+            (e.name, e.is_dir(follow_symlinks=True))
+            for e in it if not e.name.startswith('.')
+        ]
+    visible.sort(key=lambda item: (not item[1], item[0].lower()))
+
+    base = str(target)
+    entries = []
+    for name, is_dir in visible:
+        if is_dir:
+            entries.append({"name": name, "path": os.path.join(base, name), "is_dir": True})
+        elif '.' in name and name.rpartition('.')[2].lower() in _BOOK_SUFFIXES:
+            entries.append({"name": name, "path": os.path.join(base, name), "is_dir": False})
+    # Encode once here; the cached bytes are returned as-is without
+    # building a model per entry
+    return orjson.dumps(entries)
+
+
 @router.get("/browse", response_model=list[BrowseEntry])
 def browse_filesystem(dir: str = Query(default="~")):
     """List directories and .db files in a directory."""
@@ -117,20 +181,11 @@ def browse_filesystem(dir: str = Query(default="~")):
     if not target.is_dir():
         raise HTTPException(status_code=400, detail="Not a directory")
 
-    entries = []
     try:
-        for item in sorted(target.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower())):
-            if item.name.startswith('.'):
-                continue
-            if item.is_dir():
-                entries.append(BrowseEntry(name=item.name, path=str(item), is_dir=True))
-            elif item.suffix in ('.db', '.sqlite', '.sqlite3'):
-                entries.append(BrowseEntry(name=item.name, path=str(item), is_dir=False))
+        return Response(content=_list_directory(target), media_type="application/json")
     except PermissionError:
         raise HTTPException(status_code=403, detail="Permission denied")
 
-    return entries
-
 
 @router.get("/browse/parent")
 def browse_parent(dir: str = Query(default="~")):
@@ -162,74 +217,168 @@ def rename_current_book(req: RenameRequest):
     if not name:
         raise HTTPException(status_code=400, detail="Name cannot be empty")
     rename_book(path, name)
+    _invalidate_listings()
     return BookStatus(is_open=True, path=str(path), name=name)
 
 
+_BACKUP_CHUNK_SIZE = 1024 * 1024
+
+
+def _snapshot_book(book_path: Path) -> bytes:
+    """Take a consistent in-memory snapshot of a book file."""
+    src = sqlite3.connect(str(book_path))
+    dst = sqlite3.connect(":memory:")
+    try:
+        src.backup(dst)
+        return dst.serialize()
+    finally:
+        src.close()
+        dst.close()
+
+
 @router.get("/backup")
-def backup_book():
+async def backup_book():
     """Download a backup of the current book."""
     book_path = get_current_book_path()
     if not book_path:
         raise HTTPException(status_code=400, detail="No book is open")
 
-    # Use SQLite online backup API for a consistent snapshot
-    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
-    tmp.close()
-    tmp_path = Path(tmp.name)
-
+    # Use SQLite online backup API for a consistent snapshot, held in memory
+    # and streamed straight to the client
     try:
-        src = sqlite3.connect(str(book_path))
-        dst = sqlite3.connect(str(tmp_path))
-        src.backup(dst)
-        src.close()
-        dst.close()
+        data = await asyncio.to_thread(_snapshot_book, book_path)
     except Exception as e:
-        tmp_path.unlink(missing_ok=True)
         raise HTTPException(status_code=500, detail=f"Backup failed: {e}")
 
     date_str = datetime.utcnow().strftime("%Y-%m-%d")
     filename = f"{book_path.stem}_backup_{date_str}.db"
 
-    def cleanup_and_update():
-        tmp_path.unlink(missing_ok=True)
+    def iter_chunks():
+        for start in range(0, len(data), _BACKUP_CHUNK_SIZE):
+            yield data[start:start + _BACKUP_CHUNK_SIZE]
+
+    def update_timestamp():
         update_backup_timestamp(book_path)
+        _invalidate_listings()
 
-    return FileResponse(
-        path=str(tmp_path),
-        filename=filename,
+    return StreamingResponse(
+        iter_chunks(),
         media_type="application/octet-stream",
-        background=BackgroundTask(cleanup_and_update),
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(len(data)),
+        },
+        background=BackgroundTask(update_timestamp),
     )
 
 
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+
+
+def _check_integrity(book_path: Path) -> None:
+    """Run a full integrity check on a restored book and log any problems."""
+    conn = sqlite3.connect(str(book_path))
+    try:
+        result = conn.execute("PRAGMA integrity_check").fetchone()
+    except sqlite3.DatabaseError as e:
+        logger.warning("Integrity check failed for restored book %s: %s", book_path, e)
+        return
+    finally:
+        conn.close()
+    if result[0] != "ok":
+        logger.warning("Restored book %s failed integrity check: %s", book_path, result[0])
+
+
+def _read_header(path: Path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read(len(_SQLITE_MAGIC))
+
+
+def _quick_check(path: Path) -> str | None:
+    """
+    Run PRAGMA quick_check on a database file.
+
+    Returns None if the file is a readable, consistent database, otherwise
+    a short description of the problem.
+    """
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    except sqlite3.Error as e:
+        return str(e)
+    try:
+        result = conn.execute("PRAGMA quick_check").fetchone()
+    except sqlite3.DatabaseError as e:
+        return str(e)
+    finally:
+        conn.close()
+    return None if result[0] == "ok" else result[0]
+
+
+def _drop_wal_files(book_path: Path) -> None:
+    # Drop any WAL/shared-memory files left by the old book so they are not
+    # replayed on top of the replacement file
+    for suffix in ("-wal", "-shm"):
+        Path(f"{book_path}{suffix}").unlink(missing_ok=True)
+
+
+def _replace_book(source: Path, book_path: Path) -> None:
+    """
+    Close the current book, replace its file and re-open it.
+
+    The original file is kept as <book>.bak and put back if the copy or
+    re-opening fails, so a failed restore leaves the previous book open.
+    """
+    backup = Path(f"{book_path}.bak")
+    close_book()
+    _drop_wal_files(book_path)
+    os.replace(book_path, backup)
+    try:
+        shutil.copy2(source, book_path)
+        invalidate_password_cache(book_path)
+        open_book(book_path)
+    except Exception:
+        logger.exception("Restore of %s failed; putting the original back", book_path)
+        close_book()
+        _drop_wal_files(book_path)
+        os.replace(backup, book_path)
+        invalidate_password_cache(book_path)
+        open_book(book_path)
+        raise
+
+
 @router.post("/restore")
-async def restore_book(file: UploadFile = File(...)):
+async def restore_book(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
     """Restore a book from an uploaded backup file."""
     book_path = get_current_book_path()
     if not book_path:
         raise HTTPException(status_code=400, detail="No book is open")
 
-    # Save upload to temp file
+    # Stream upload to temp file in 1 MiB chunks
     tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
     try:
-        contents = await file.read()
-        tmp.write(contents)
+        await asyncio.to_thread(shutil.copyfileobj, file.file, tmp, 1024 * 1024)
         tmp.close()
 
-        # Validate the uploaded file
-        try:
-            conn = sqlite3.connect(tmp.name)
-            result = conn.execute("PRAGMA integrity_check").fetchone()
-            conn.close()
-            if result[0] != "ok":
-                raise HTTPException(status_code=400, detail="Uploaded file failed integrity check")
-        except sqlite3.DatabaseError:
+        # Cheap validation first: every SQLite database starts with this
+        # header. quick_check then catches truncated or damaged files before
+        # the live book is touched; the full page scan runs after the
+        # response is sent.
+        magic = await asyncio.to_thread(_read_header, Path(tmp.name))
+        if magic != _SQLITE_MAGIC:
             raise HTTPException(status_code=400, detail="Uploaded file is not a valid SQLite database")
+        problem = await asyncio.to_thread(_quick_check, Path(tmp.name))
+        if problem is not None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Uploaded file is not a valid SQLite database: {problem}",
+            )
 
-        # Close current book, replace file, re-open
-        close_book()
-        shutil.copy2(tmp.name, str(book_path))
-        open_book(book_path)
+        try:
+            await asyncio.to_thread(_replace_book, Path(tmp.name), book_path)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Could not restore backup: {e}")
+
+        background_tasks.add_task(_check_integrity, book_path)
 
         return BookStatus(
             is_open=True,
@@ -258,24 +407,29 @@ class RemovePasswordRequest(BaseModel):
     current_password: str
 
 
+# Book settings live in a single row; compile the lookup once
+_GET_SETTINGS = lambda_stmt(lambda: select(BookSettings).where(BookSettings.id == 1))
+
+
 @router.post("/password")
-def set_book_password(req: SetPasswordRequest):
+async def set_book_password(req: SetPasswordRequest):
     """Set or change the book password."""
     if not is_book_open():
         raise HTTPException(status_code=400, detail="No book is open")
 
-    db = next(get_db())
-    try:
-        settings = db.query(BookSettings).filter(BookSettings.id == 1).first()
+    async with get_async_session() as db, db.begin():
+        settings = await db.scalar(_GET_SETTINGS)
 
         # If password already set, verify current password
         if settings and settings.password_hash:
             if not req.current_password:
                 raise HTTPException(status_code=403, detail="Current password required")
-            if not verify_password(req.current_password, settings.password_salt, settings.password_hash):
+            if not await asyncio.to_thread(
+                verify_password, req.current_password, settings.password_salt, settings.password_hash
+            ):
                 raise HTTPException(status_code=403, detail="Incorrect current password")
 
-        new_hash, new_salt = hash_password(req.new_password)
+        new_hash, new_salt = await asyncio.to_thread(hash_password, req.new_password)
 
         if settings:
             settings.password_hash = new_hash
@@ -284,41 +438,29 @@ def set_book_password(req: SetPasswordRequest):
             settings = BookSettings(id=1, password_hash=new_hash, password_salt=new_salt)
             db.add(settings)
 
-        db.commit()
-        return {"message": "Password set"}
-    except HTTPException:
-        raise
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    invalidate_password_cache(get_current_book_path())
+    return {"message": "Password set"}
 
 
 @router.post("/password/remove")
-def remove_book_password(req: RemovePasswordRequest):
+async def remove_book_password(req: RemovePasswordRequest):
     """Remove the book password."""
     if not is_book_open():
         raise HTTPException(status_code=400, detail="No book is open")
 
-    db = next(get_db())
-    try:
-        settings = db.query(BookSettings).filter(BookSettings.id == 1).first()
+    async with get_async_session() as db, db.begin():
+        settings = await db.scalar(_GET_SETTINGS)
 
         if not settings or not settings.password_hash:
             raise HTTPException(status_code=400, detail="No password is set")
 
-        if not verify_password(req.current_password, settings.password_salt, settings.password_hash):
+        if not await asyncio.to_thread(
+            verify_password, req.current_password, settings.password_salt, settings.password_hash
+        ):
             raise HTTPException(status_code=403, detail="Incorrect password")
 
         settings.password_hash = None
         settings.password_salt = None
-        db.commit()
-        return {"message": "Password removed"}
-    except HTTPException:
-        raise
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+
+    invalidate_password_cache(get_current_book_path())
+    return {"message": "Password removed"}
@@ -1,23 +1,48 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..database import get_db, get_async_db, get_book_generation, on_commit
 from ..models import Category
 from ..schemas import CategoryCreate, CategoryUpdate, CategoryResponse
 
 router = APIRouter()
 
+# Categories change rarely but are listed constantly. Cache the serialized
+# list keyed on (book generation, categories version); writes bump the
+# version once their transaction has committed.
+_categories_version = 0
+_categories_cache: dict[tuple[int, int], list[dict]] = {}
+
+
+def _bump_categories_version() -> None:
+    global _categories_version
+    _categories_version += 1
+    _categories_cache.clear()
+
 
 @router.get("/", response_model=list[CategoryResponse])
-def list_categories(db: Session = Depends(get_db)):
+async def list_categories(db: AsyncSession = Depends(get_async_db)):
     """Get all categories."""
-    return db.query(Category).order_by(Category.display_order, Category.name).all()
+    key = (get_book_generation(), _categories_version)
+    cached = _categories_cache.get(key)
+    if cached is not None:
+        return cached
+
+    categories = await db.scalars(
+        select(Category).order_by(Category.display_order, Category.name)
+    )
+    result = [CategoryResponse.from_orm_fast(c).model_dump() for c in categories]
+    _categories_cache.clear()
+    _categories_cache[key] = result
+    return result
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
 def get_category(category_id: int, db: Session = Depends(get_db)):
     """Get a single category by ID."""
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = db.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     return category
@@ -27,14 +52,14 @@ def get_category(category_id: int, db: Session = Depends(get_db)):
 def create_category(category: CategoryCreate, db: Session = Depends(get_db)):
     """Create a new category."""
     if category.parent_id:
-        parent = db.query(Category).filter(Category.id == category.parent_id).first()
+        parent = db.get(Category, category.parent_id)
         if not parent:
             raise HTTPException(status_code=404, detail="Parent category not found")
 
     db_category = Category(**category.model_dump())
     db.add(db_category)
     db.flush()
-    db.refresh(db_category)
+    on_commit(db, _bump_categories_version)
     return db_category
 
 
@@ -45,7 +70,7 @@ def update_category(
     db: Session = Depends(get_db)
 ):
     """Update a category."""
-    db_category = db.query(Category).filter(Category.id == category_id).first()
+    db_category = db.get(Category, category_id)
     if not db_category:
         raise HTTPException(status_code=404, detail="Category not found")
 
@@ -55,7 +80,7 @@ def update_category(
         # Prevent circular references
         if update_data["parent_id"] == category_id:
             raise HTTPException(status_code=400, detail="Category cannot be its own parent")
-        parent = db.query(Category).filter(Category.id == update_data["parent_id"]).first()
+        parent = db.get(Category, update_data["parent_id"])
         if not parent:
             raise HTTPException(status_code=404, detail="Parent category not found")
 
@@ -63,24 +88,27 @@ def update_category(
         setattr(db_category, field, value)
 
     db.flush()
-    db.refresh(db_category)
+    on_commit(db, _bump_categories_version)
     return db_category
 
 
 @router.delete("/{category_id}", status_code=204)
 def delete_category(category_id: int, db: Session = Depends(get_db)):
     """Delete a category."""
-    db_category = db.query(Category).filter(Category.id == category_id).first()
+    db_category = db.get(Category, category_id)
     if not db_category:
         raise HTTPException(status_code=404, detail="Category not found")
 
-    # Check for child categories
-    children = db.query(Category).filter(Category.parent_id == category_id).count()
-    if children > 0:
+    # Check for child categories (stops at the first one)
+    has_children = db.query(
+        exists().where(Category.parent_id == category_id)
+    ).scalar()
+    if has_children:
         raise HTTPException(
             status_code=400,
             detail="Cannot delete category with subcategories"
         )
 
     db.delete(db_category)
+    on_commit(db, _bump_categories_version)
     return None
@@ -2,6 +2,7 @@ from datetime import date
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -35,38 +36,52 @@ def dismiss_forecast(req: DismissRequest, db: Session = Depends(get_db)):
     """Dismiss a forecast for a specific payee/account/month."""
     period = date.fromisoformat(req.period_date)
 
-    # Check if already dismissed
-    existing = db.query(ForecastDismissal).filter(
-        ForecastDismissal.payee_id == req.payee_id,
-        ForecastDismissal.account_id == req.account_id,
-        ForecastDismissal.period_date == period,
-    ).first()
-
-    if existing:
-        return {"status": "already_dismissed"}
-
-    dismissal = ForecastDismissal(
+    # Single INSERT ... ON CONFLICT DO NOTHING against the
+    # (payee_id, account_id, period_date) unique constraint
+    stmt = sqlite_insert(ForecastDismissal).values(
         payee_id=req.payee_id,
         account_id=req.account_id,
         period_date=period,
+    ).on_conflict_do_nothing(
+        index_elements=["payee_id", "account_id", "period_date"]
     )
-    db.add(dismissal)
-    db.flush()
+    result = db.execute(stmt)
+    if result.rowcount == 0:
+        return {"status": "already_dismissed"}
     return {"status": "dismissed"}
 
 
+def _count_active_dismissals(db: Session, payee_ids: list[int]) -> dict[int, int]:
+    """Count active dismissals (current month and future) per payee in one query."""
+    current_month = date.today().replace(day=1)
+    rows = db.query(
+        ForecastDismissal.payee_id, func.count(ForecastDismissal.id)
+    ).filter(
+        ForecastDismissal.payee_id.in_(payee_ids),
+        ForecastDismissal.period_date >= current_month,
+    ).group_by(ForecastDismissal.payee_id).all()
+
+    counts = dict.fromkeys(payee_ids, 0)
+    counts.update(rows)
+    return counts
+
+
 @router.get("/dismissals/count")
 def count_dismissals_for_payee(
     payee_id: int = Query(...),
     db: Session = Depends(get_db),
 ):
     """Count active dismissals (current month and future) for a payee."""
-    current_month = date.today().replace(day=1)
-    count = db.query(func.count(ForecastDismissal.id)).filter(
-        ForecastDismissal.payee_id == payee_id,
-        ForecastDismissal.period_date >= current_month,
-    ).scalar()
-    return {"count": count or 0}
+    return {"count": _count_active_dismissals(db, [payee_id])[payee_id]}
+
+
+@router.get("/dismissals/counts")
+def count_dismissals_for_payees(
+    payee_ids: list[int] = Query(...),
+    db: Session = Depends(get_db),
+):
+    """Count active dismissals for several payees, keyed by payee ID."""
+    return _count_active_dismissals(db, payee_ids)
 
 
 @router.delete("/dismissals")
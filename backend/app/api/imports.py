@@ -1,9 +1,13 @@
+import csv
+import io
+from itertools import chain
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models import Account, TransactionSource
-from ..services.csv_parser import CSVParser, detect_columns, ParsedTransaction
+from ..services.csv_parser import CSVParser, detect_columns
 from ..services.ofx_parser import parse_ofx_file
 from ..services.import_service import ImportService
 from ..schemas.import_schemas import (
@@ -12,7 +16,6 @@ from ..schemas.import_schemas import (
     CSVPreviewResponse,
     ParsedTransactionResponse,
     DuplicateResponse,
-    ExistingTransactionInfo,
     ImportCommitRequest,
     ImportCommitResponse,
     ImportProfileResponse,
@@ -22,8 +25,17 @@ from ..schemas.import_schemas import (
 
 router = APIRouter()
 
+# Previews can carry thousands of rows built from already-typed parser
+# output, so those handlers dump them straight to ORJSONResponse instead of
+# having FastAPI re-validate the payload; the schema is listed under
+# responses for the OpenAPI docs.
 
-@router.post("/csv/preview", response_model=CSVPreviewResponse)
+
+@router.post(
+    "/csv/preview",
+    response_class=ORJSONResponse,
+    responses={200: {"model": CSVPreviewResponse}},
+)
 def preview_csv_import(
     request: CSVUploadRequest,
     db: Session = Depends(get_db)
@@ -34,7 +46,7 @@ def preview_csv_import(
     Returns detected mappings, parsed transactions, and potential duplicates.
     """
     # Verify account exists
-    account = db.query(Account).filter(Account.id == request.account_id).first()
+    account = db.get(Account, request.account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
@@ -69,20 +81,22 @@ def preview_csv_import(
         has_header=request.has_header
     )
 
-    # First pass: just get headers
-    lines = request.content.strip().split('\n')
-    if request.skip_rows > 0:
-        lines = lines[request.skip_rows:]
+    # First pass: just get headers, reading only as far as the first row
+    buf = io.StringIO(request.content.strip(), newline="")
+    for _ in range(request.skip_rows):
+        buf.readline()
+    reader = csv.reader(buf, delimiter=request.delimiter)
+    first_row = next(reader, None)
 
-    if not lines:
+    if first_row is None:
         raise HTTPException(status_code=400, detail="Empty CSV file")
 
-    import csv
     if request.has_header:
-        headers = next(csv.reader([lines[0]], delimiter=request.delimiter))
+        headers = first_row
+        data_rows = reader
     else:
-        num_cols = len(next(csv.reader([lines[0]], delimiter=request.delimiter)))
-        headers = [f"Column {i + 1}" for i in range(num_cols)]
+        headers = [f"Column {i + 1}" for i in range(len(first_row))]
+        data_rows = chain([first_row], reader)
     header_signature = parser._compute_header_signature(headers)
 
     # Check for matching profile (only when headers are present)
@@ -136,8 +150,12 @@ def preview_csv_import(
             has_header=request.has_header
         )
 
-    # Parse the full file
-    parse_result = parser.parse(request.content)
+    # Parse the rest of the file off the same reader, unless a matched
+    # profile splits the file differently
+    if parser.delimiter == request.delimiter and parser.skip_rows == request.skip_rows:
+        parse_result = parser.parse_rows(data_rows, headers)
+    else:
+        parse_result = parser.parse(request.content)
 
     # Generate import preview with duplicate detection
     preview = import_service.preview_import(request.account_id, parse_result)
@@ -145,21 +163,9 @@ def preview_csv_import(
     # Build response
     new_txs = [ParsedTransactionResponse.from_parsed(tx) for tx in preview.new_transactions]
 
-    duplicates = []
-    for dup in preview.duplicates:
-        duplicates.append(DuplicateResponse(
-            parsed=ParsedTransactionResponse.from_parsed(dup.parsed_tx),
-            existing=ExistingTransactionInfo(
-                id=dup.existing_tx.id,
-                posted_date=dup.existing_tx.posted_date,
-                amount_cents=dup.existing_tx.amount_cents,
-                payee_raw=dup.existing_tx.payee_raw,
-                memo=dup.existing_tx.memo
-            ),
-            fingerprint=dup.fingerprint
-        ))
-
-    return CSVPreviewResponse(
+    duplicates = [DuplicateResponse.from_duplicate(dup) for dup in preview.duplicates]
+
+    response = CSVPreviewResponse.model_construct(
         headers=parse_result.headers,
         header_signature=header_signature,
         detected_date_format=parse_result.detected_date_format,
@@ -175,9 +181,14 @@ def preview_csv_import(
         matched_profile_id=matched_profile.id if matched_profile else None,
         matched_profile_name=matched_profile.name if matched_profile else None
     )
+    return ORJSONResponse(response.model_dump())
 
 
-@router.post("/ofx/preview", response_model=CSVPreviewResponse)
+@router.post(
+    "/ofx/preview",
+    response_class=ORJSONResponse,
+    responses={200: {"model": CSVPreviewResponse}},
+)
 def preview_ofx_import(
     request: OFXUploadRequest,
     db: Session = Depends(get_db)
@@ -187,7 +198,7 @@ def preview_ofx_import(
 
     OFX has a fixed structure, so no column mapping step is needed.
     """
-    account = db.query(Account).filter(Account.id == request.account_id).first()
+    account = db.get(Account, request.account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
@@ -201,21 +212,9 @@ def preview_ofx_import(
 
     new_txs = [ParsedTransactionResponse.from_parsed(tx) for tx in preview.new_transactions]
 
-    duplicates = []
-    for dup in preview.duplicates:
-        duplicates.append(DuplicateResponse(
-            parsed=ParsedTransactionResponse.from_parsed(dup.parsed_tx),
-            existing=ExistingTransactionInfo(
-                id=dup.existing_tx.id,
-                posted_date=dup.existing_tx.posted_date,
-                amount_cents=dup.existing_tx.amount_cents,
-                payee_raw=dup.existing_tx.payee_raw,
-                memo=dup.existing_tx.memo
-            ),
-            fingerprint=dup.fingerprint
-        ))
-
-    return CSVPreviewResponse(
+    duplicates = [DuplicateResponse.from_duplicate(dup) for dup in preview.duplicates]
+
+    response = CSVPreviewResponse.model_construct(
         headers=parse_result.headers,
         header_signature=parse_result.header_signature,
         detected_date_format=None,
@@ -229,6 +228,7 @@ def preview_ofx_import(
         error_count=preview.error_count,
         errors=preview.errors,
     )
+    return ORJSONResponse(response.model_dump())
 
 
 @router.post("/commit", response_model=ImportCommitResponse)
@@ -239,27 +239,12 @@ def commit_import(
     """
     Commit a previewed import batch.
     """
-    account = db.query(Account).filter(Account.id == request.account_id).first()
+    account = db.get(Account, request.account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
     import_service = ImportService(db)
 
-    # Convert response objects back to ParsedTransaction for import
-    transactions = []
-    for tx in request.transactions:
-        transactions.append(ParsedTransaction(
-            row_index=tx.row_index,
-            posted_date=tx.posted_date,
-            amount_cents=tx.amount_cents,
-            payee_raw=tx.payee_raw,
-            memo=tx.memo,
-            fingerprint=tx.fingerprint,
-            external_id=tx.external_id,
-            raw_data=tx.raw_data,
-            warnings=tx.warnings
-        ))
-
     source_map = {
         "import_csv": TransactionSource.IMPORT_CSV,
         "import_qfx": TransactionSource.IMPORT_QFX,
@@ -269,7 +254,9 @@ def commit_import(
     result = import_service.commit_import(
         account_id=request.account_id,
         batch_id=request.batch_id,
-        transactions=transactions,
+        # The validated request items carry every field commit_import reads,
+        # so they are passed through without copying into ParsedTransaction
+        transactions=request.transactions,
         accepted_duplicate_indices=request.accepted_duplicate_indices,
         source=source
     )
@@ -299,7 +286,7 @@ def create_import_profile(
     db: Session = Depends(get_db)
 ):
     """Create a new import profile."""
-    account = db.query(Account).filter(Account.id == request.account_id).first()
+    account = db.get(Account, request.account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
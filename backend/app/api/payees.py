@@ -1,46 +1,51 @@
+import logging
+import threading
+import uuid
 from datetime import date as date_type
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from ..database import get_db
+from ..database import get_db, get_async_db, get_session
 from ..models import Payee, Transaction, TransactionType, RecurringTemplate, AmountMethod, Frequency
 from ..schemas.payee import (
     PayeeCreate, PayeeUpdate, PayeeResponse, RematchResponse, RecurringRule, MatchPattern
 )
-from ..services.payee_matcher import rematch_all, matches_payee, matches_patterns, rematch_payee
+from ..services.payee_matcher import rematch_all, rematch_payee, build_combined_matcher
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Re-match jobs run after the response is sent; their status is kept here
+# (process-local, expires after an hour) for the client to poll.
+_rematch_jobs: TTLCache = TTLCache(maxsize=128, ttl=3600)
+_rematch_jobs_lock = threading.Lock()
 
-def _build_recurring_rule(template: RecurringTemplate) -> RecurringRule:
-    """Convert a RecurringTemplate model to a RecurringRule schema."""
-    return RecurringRule(
-        account_id=template.account_id,
-        frequency=template.frequency.value,
-        frequency_n=template.frequency_n,
-        day_of_month=template.day_of_month,
-        amount_method=template.amount_method.value,
-        fixed_amount_cents=template.fixed_amount_cents,
-        average_count=template.average_count,
-        start_date=template.start_date.isoformat(),
-        end_date=template.end_date.isoformat() if template.end_date else None,
-        category_id=template.category_id,
-    )
+
+def _dump_patterns(patterns: list[MatchPattern | dict]) -> list[dict]:
+    """Convert match patterns to plain dicts, passing through ones already dumped."""
+    return [
+        p if isinstance(p, dict) else p.model_dump(mode="python")
+        for p in patterns
+    ]
 
 
-def _build_response(payee: Payee, db: Session) -> PayeeResponse:
+def _build_response(payee: Payee) -> PayeeResponse:
     """Build PayeeResponse including recurring_rule from linked template."""
-    template = db.query(RecurringTemplate).filter(
-        RecurringTemplate.payee_id == payee.id,
-        RecurringTemplate.is_active == True,
-    ).first()
+    template = next(
+        (t for t in payee.recurring_templates if t.is_active), None
+    )
 
     return PayeeResponse(
         id=payee.id,
         name=payee.name,
-        match_patterns=[MatchPattern(**p) for p in payee.match_patterns],
+        # Stored patterns were validated on write; skip re-validating them here
+        match_patterns=[MatchPattern.model_construct(**p) for p in payee.match_patterns],
         default_category_id=payee.default_category_id,
-        recurring_rule=_build_recurring_rule(template) if template else None,
+        recurring_rule=RecurringRule.model_validate(template) if template else None,
         created_at=payee.created_at,
         updated_at=payee.updated_at,
     )
@@ -81,19 +86,23 @@ def _delete_recurring_template(db: Session, payee_id: int) -> None:
 
 
 @router.get("/")
-def list_payees(db: Session = Depends(get_db)):
+async def list_payees(db: AsyncSession = Depends(get_async_db)):
     """Get all payees."""
-    payees = db.query(Payee).order_by(Payee.name).all()
-    return [_build_response(p, db) for p in payees]
+    payees = await db.scalars(
+        select(Payee)
+        .options(selectinload(Payee.recurring_templates))
+        .order_by(Payee.name)
+    )
+    return [_build_response(p) for p in payees]
 
 
 @router.get("/{payee_id}")
 def get_payee(payee_id: int, db: Session = Depends(get_db)):
     """Get a single payee by ID."""
-    payee = db.query(Payee).filter(Payee.id == payee_id).first()
+    payee = db.get(Payee, payee_id)
     if not payee:
         raise HTTPException(status_code=404, detail="Payee not found")
-    return _build_response(payee, db)
+    return _build_response(payee)
 
 
 @router.post("/", status_code=201)
@@ -101,7 +110,7 @@ def create_payee(payee: PayeeCreate, db: Session = Depends(get_db)):
     """Create a new payee."""
     db_payee = Payee(
         name=payee.name,
-        match_patterns=[p.model_dump() for p in payee.match_patterns],
+        match_patterns=_dump_patterns(payee.match_patterns),
         default_category_id=payee.default_category_id
     )
     db.add(db_payee)
@@ -111,8 +120,7 @@ def create_payee(payee: PayeeCreate, db: Session = Depends(get_db)):
         _upsert_recurring_template(db, db_payee, payee.recurring_rule)
         db.flush()
 
-    db.refresh(db_payee)
-    return _build_response(db_payee, db)
+    return _build_response(db_payee)
 
 
 @router.patch("/{payee_id}")
@@ -122,7 +130,7 @@ def update_payee(
     db: Session = Depends(get_db)
 ):
     """Update a payee."""
-    db_payee = db.query(Payee).filter(Payee.id == payee_id).first()
+    db_payee = db.get(Payee, payee_id)
     if not db_payee:
         raise HTTPException(status_code=404, detail="Payee not found")
 
@@ -133,10 +141,7 @@ def update_payee(
     remove_recurring = update_data.pop("remove_recurring_rule", False)
 
     if "match_patterns" in update_data and update_data["match_patterns"] is not None:
-        update_data["match_patterns"] = [
-            p.model_dump() if hasattr(p, "model_dump") else p
-            for p in update_data["match_patterns"]
-        ]
+        update_data["match_patterns"] = _dump_patterns(update_data["match_patterns"])
 
     for field, value in update_data.items():
         setattr(db_payee, field, value)
@@ -148,42 +153,92 @@ def update_payee(
         _upsert_recurring_template(db, db_payee, rule)
 
     db.flush()
-    db.refresh(db_payee)
-    return _build_response(db_payee, db)
+    return _build_response(db_payee)
 
 
 @router.delete("/{payee_id}", status_code=204)
 def delete_payee(payee_id: int, db: Session = Depends(get_db)):
     """Delete a payee."""
-    db_payee = db.query(Payee).filter(Payee.id == payee_id).first()
+    db_payee = db.get(Payee, payee_id)
     if not db_payee:
         raise HTTPException(status_code=404, detail="Payee not found")
-    _delete_recurring_template(db, payee_id)
+    # Linked recurring templates go with it via ON DELETE CASCADE
     db.delete(db_payee)
     return None
 
 
-@router.post("/rematch", response_model=RematchResponse)
-def rematch_payees(db: Session = Depends(get_db)):
-    """Re-run payee matching on all transactions."""
-    updated_count = rematch_all(db)
-    return RematchResponse(updated_count=updated_count)
-
-
-@router.post("/{payee_id}/rematch", response_model=RematchResponse)
-def rematch_single_payee(payee_id: int, db: Session = Depends(get_db)):
-    """Re-run payee matching for a single payee."""
-    payee = db.query(Payee).filter(Payee.id == payee_id).first()
+def _set_rematch_job(job_id: str, **fields) -> RematchResponse:
+    with _rematch_jobs_lock:
+        job = _rematch_jobs.get(job_id) or RematchResponse(job_id=job_id, status="queued")
+        job = job.model_copy(update=fields)
+        _rematch_jobs[job_id] = job
+    return job
+
+
+def _run_rematch(job_id: str, payee_id: int | None) -> None:
+    """Run a re-match in its own session, recording progress on the job."""
+    _set_rematch_job(job_id, status="running")
+    try:
+        db = get_session()
+        try:
+            if payee_id is None:
+                updated_count = rematch_all(db)
+            else:
+                payee = db.get(Payee, payee_id)
+                updated_count = rematch_payee(db, payee) if payee else 0
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    except Exception as e:
+        logger.exception("Payee re-match job %s failed", job_id)
+        _set_rematch_job(job_id, status="failed", error=str(e))
+        return
+    _set_rematch_job(job_id, status="completed", updated_count=updated_count)
+
+
+def _queue_rematch(background_tasks: BackgroundTasks, payee_id: int | None) -> RematchResponse:
+    job_id = uuid.uuid4().hex
+    job = _set_rematch_job(job_id, status="queued")
+    background_tasks.add_task(_run_rematch, job_id, payee_id)
+    return job
+
+
+@router.post("/rematch", response_model=RematchResponse, status_code=202)
+def rematch_payees(background_tasks: BackgroundTasks):
+    """Queue a re-match of payees across all transactions."""
+    return _queue_rematch(background_tasks, None)
+
+
+@router.get("/rematch/status/{job_id}", response_model=RematchResponse)
+def rematch_status(job_id: str):
+    """Get the status of a queued re-match job."""
+    with _rematch_jobs_lock:
+        job = _rematch_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Re-match job not found")
+    return job
+
+
+@router.post("/{payee_id}/rematch", response_model=RematchResponse, status_code=202)
+def rematch_single_payee(
+    payee_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """Queue a re-match for a single payee."""
+    payee = db.get(Payee, payee_id)
     if not payee:
         raise HTTPException(status_code=404, detail="Payee not found")
-    updated_count = rematch_payee(db, payee)
-    return RematchResponse(updated_count=updated_count)
+    return _queue_rematch(background_tasks, payee_id)
 
 
 @router.get("/{payee_id}/latest-transaction")
 def latest_transaction(payee_id: int, db: Session = Depends(get_db)):
     """Find the most recent actual transaction matching this payee's display_name."""
-    payee = db.query(Payee).filter(Payee.id == payee_id).first()
+    payee = db.get(Payee, payee_id)
     if not payee:
         raise HTTPException(status_code=404, detail="Payee not found")
 
@@ -209,22 +264,24 @@ def latest_transaction(payee_id: int, db: Session = Depends(get_db)):
     }
 
 
+def _distinct_payee_raws(db: Session) -> list[str]:
+    """All distinct non-empty payee_raw values, deduplicated in SQL."""
+    rows = db.query(Transaction.payee_raw).filter(
+        Transaction.payee_raw.isnot(None),
+        Transaction.payee_raw != "",
+    ).distinct()
+    return [raw for (raw,) in rows]
+
+
 @router.get("/{payee_id}/matches", response_model=list[str])
 def list_payee_matches(payee_id: int, db: Session = Depends(get_db)):
     """List distinct raw payees that match this payee's patterns."""
-    payee = db.query(Payee).filter(Payee.id == payee_id).first()
+    payee = db.get(Payee, payee_id)
     if not payee:
         raise HTTPException(status_code=404, detail="Payee not found")
 
-    transactions = db.query(Transaction).filter(
-        Transaction.payee_raw.isnot(None)
-    ).all()
-
-    matches = {
-        tx.payee_raw
-        for tx in transactions
-        if tx.payee_raw and matches_payee(payee, tx.payee_raw)
-    }
+    matcher = build_combined_matcher(payee.match_patterns)
+    matches = [raw for raw in _distinct_payee_raws(db) if matcher(raw)]
 
     return sorted(matches, key=lambda value: value.lower())
 
@@ -232,17 +289,7 @@ def list_payee_matches(payee_id: int, db: Session = Depends(get_db)):
 @router.post("/preview-matches", response_model=list[str])
 def preview_payee_matches(payee: PayeeCreate, db: Session = Depends(get_db)):
     """Preview distinct raw payees that would match the provided patterns."""
-    transactions = db.query(Transaction).filter(
-        Transaction.payee_raw.isnot(None)
-    ).all()
-
-    matches = {
-        tx.payee_raw
-        for tx in transactions
-        if tx.payee_raw and matches_patterns(
-            [p.model_dump() for p in payee.match_patterns],
-            tx.payee_raw
-        )
-    }
+    matcher = build_combined_matcher(_dump_patterns(payee.match_patterns))
+    matches = [raw for raw in _distinct_payee_raws(db) if matcher(raw)]
 
     return sorted(matches, key=lambda value: value.lower())
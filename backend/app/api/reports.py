@@ -1,15 +1,53 @@
+import os
+import threading
 from datetime import date
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..database import get_db, get_book_generation, get_data_version
 from ..schemas import CategorySpendItem, PayeeSpendItem, MonthlySpendItem
 from ..services.report_service import ReportService
 
 router = APIRouter()
 
+# Handlers build their ORJSONResponse themselves; item schemas are listed under
+# `responses` for the API docs only, so rows are never validated on the way out.
 
-@router.get("/spending-by-category", response_model=list[CategorySpendItem])
+# Report aggregations are recomputed only when the book has changed since
+# they were cached (data version) or the TTL has passed.
+REPORTS_CACHE_TTL = int(os.environ.get("REPORTS_CACHE_TTL", "60"))
+_reports_cache: TTLCache = TTLCache(maxsize=256, ttl=REPORTS_CACHE_TTL)
+_reports_cache_lock = threading.Lock()
+
+
+def _cached_report(name: str, params: tuple, build):
+    """
+    Return a report as JSON, building it on a cache miss.
+
+    Rows are already plain dicts shaped like the response model, so they go
+    straight to orjson without a Pydantic pass.
+    """
+    key = (name, get_book_generation(), get_data_version(), params)
+    with _reports_cache_lock:
+        cached = _reports_cache.get(key)
+    if cached is None:
+        cached = build()
+        with _reports_cache_lock:
+            _reports_cache[key] = cached
+    return ORJSONResponse(cached)
+
+
+def _ids_key(ids: list[int] | None) -> tuple[int, ...]:
+    return tuple(sorted(set(ids or ())))
+
+
+@router.get(
+    "/spending-by-category",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[CategorySpendItem]}},
+)
 def spending_by_category(
     start_date: date | None = Query(None),
     end_date: date | None = Query(None),
@@ -19,23 +57,32 @@ def spending_by_category(
     group_by_parent: bool = Query(True),
     db: Session = Depends(get_db),
 ):
-    service = ReportService(db)
-    rows = service.spending_by_category(
-        start_date=start_date,
-        end_date=end_date,
-        account_ids=account_id,
-        category_ids=category_id,
-        include_transfers=include_transfers,
-        group_by_parent=group_by_parent,
-    )
+    def build():
+        service = ReportService(db)
+        return service.spending_by_category(
+            start_date=start_date,
+            end_date=end_date,
+            account_ids=account_id,
+            category_ids=category_id,
+            include_transfers=include_transfers,
+            group_by_parent=group_by_parent,
+        )
 
-    return [
-        CategorySpendItem(**row)
-        for row in rows
-    ]
+    return _cached_report(
+        "spending-by-category",
+        (
+            start_date, end_date, _ids_key(account_id), _ids_key(category_id),
+            include_transfers, group_by_parent,
+        ),
+        build,
+    )
 
 
-@router.get("/spending-by-category/{parent_id}/children", response_model=list[CategorySpendItem])
+@router.get(
+    "/spending-by-category/{parent_id}/children",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[CategorySpendItem]}},
+)
 def spending_by_category_children(
     parent_id: int,
     start_date: date | None = Query(None),
@@ -44,22 +91,28 @@ def spending_by_category_children(
     include_transfers: bool = Query(False),
     db: Session = Depends(get_db),
 ):
-    service = ReportService(db)
-    rows = service.spending_by_category_children(
-        parent_category_id=parent_id,
-        start_date=start_date,
-        end_date=end_date,
-        account_ids=account_id,
-        include_transfers=include_transfers,
-    )
+    def build():
+        service = ReportService(db)
+        return service.spending_by_category_children(
+            parent_category_id=parent_id,
+            start_date=start_date,
+            end_date=end_date,
+            account_ids=account_id,
+            include_transfers=include_transfers,
+        )
 
-    return [
-        CategorySpendItem(**row)
-        for row in rows
-    ]
+    return _cached_report(
+        "spending-by-category-children",
+        (parent_id, start_date, end_date, _ids_key(account_id), include_transfers),
+        build,
+    )
 
 
-@router.get("/spending-by-payee", response_model=list[PayeeSpendItem])
+@router.get(
+    "/spending-by-payee",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[PayeeSpendItem]}},
+)
 def spending_by_payee(
     start_date: date | None = Query(None),
     end_date: date | None = Query(None),
@@ -68,27 +121,31 @@ def spending_by_payee(
     include_transfers: bool = Query(False),
     db: Session = Depends(get_db),
 ):
-    service = ReportService(db)
-    rows = service.spending_by_payee(
-        start_date=start_date,
-        end_date=end_date,
-        account_ids=account_id,
-        category_ids=category_id,
-        include_transfers=include_transfers,
-    )
-
-    return [
-        PayeeSpendItem(
-            payee_name=row.payee_name,
-            income_cents=int(row.income_cents or 0),
-            expense_cents=int(row.expense_cents or 0),
-            transaction_count=int(row.transaction_count or 0),
+    def build():
+        service = ReportService(db)
+        return service.spending_by_payee(
+            start_date=start_date,
+            end_date=end_date,
+            account_ids=account_id,
+            category_ids=category_id,
+            include_transfers=include_transfers,
         )
-        for row in rows
-    ]
+
+    return _cached_report(
+        "spending-by-payee",
+        (
+            start_date, end_date, _ids_key(account_id), _ids_key(category_id),
+            include_transfers,
+        ),
+        build,
+    )
 
 
-@router.get("/spending-trends", response_model=list[MonthlySpendItem])
+@router.get(
+    "/spending-trends",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[MonthlySpendItem]}},
+)
 def spending_trends(
     start_date: date | None = Query(None),
     end_date: date | None = Query(None),
@@ -97,21 +154,21 @@ def spending_trends(
     include_transfers: bool = Query(False),
     db: Session = Depends(get_db),
 ):
-    service = ReportService(db)
-    rows = service.spending_trends(
-        start_date=start_date,
-        end_date=end_date,
-        account_ids=account_id,
-        category_ids=category_id,
-        include_transfers=include_transfers,
-    )
-
-    return [
-        MonthlySpendItem(
-            year=int(row.year),
-            month=int(row.month),
-            income_cents=int(row.income_cents or 0),
-            expense_cents=int(row.expense_cents or 0),
+    def build():
+        service = ReportService(db)
+        return service.spending_trends(
+            start_date=start_date,
+            end_date=end_date,
+            account_ids=account_id,
+            category_ids=category_id,
+            include_transfers=include_transfers,
         )
-        for row in rows
-    ]
+
+    return _cached_report(
+        "spending-trends",
+        (
+            start_date, end_date, _ids_key(account_id), _ids_key(category_id),
+            include_transfers,
+        ),
+        build,
+    )
@@ -1,9 +1,12 @@
 from datetime import date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, extract, func, or_
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import (
+    column, insert, lambda_stmt, literal_column, or_, select, table, update,
+)
 
-from ..database import get_db
+from ..database import get_db, has_payee_fts
 from ..models import Transaction, Account, TransactionType
 from ..schemas import (
     TransactionCreate,
@@ -16,12 +19,26 @@ from ..services.payee_matcher import apply_payee_match
 
 router = APIRouter()
 
+_LIST_CHUNK_SIZE = 1000
+
+# FTS5 index over the payee columns, maintained by triggers (see database.py)
+_payee_fts = table("tx_payee_fts", column("rowid"))
+
+# Columns behind TransactionResponse, fetched as rows for the list endpoint;
+# amount is derived from amount_cents in the query itself
+_RESPONSE_COLUMNS = [
+    getattr(Transaction, name)
+    for name in TransactionResponse.model_fields
+    if name != "amount"
+] + [(Transaction.amount_cents / 100.0).label("amount")]
+_LIST_SELECT = select(*_RESPONSE_COLUMNS)
+
 
 @router.get("/", response_model=list[TransactionResponse])
 def list_transactions(
     account_id: int | None = None,
-    year: int | None = None,
-    month: int | None = None,
+    year: int | None = Query(None, ge=1, le=9998),
+    month: int | None = Query(None, ge=1, le=12),
     start_date: date | None = Query(None),
     end_date: date | None = Query(None),
     category_id: list[int] | None = Query(None),
@@ -38,54 +55,65 @@ def list_transactions(
     If year/month provided, returns transactions for that month.
     start_date/end_date, category_id, and payee_name support drill-down from reports.
     """
-    query = db.query(Transaction)
+    # Each filter is a lambda so SQLAlchemy caches the compiled SQL per filter
+    # combination; the values captured in the closures become bound parameters
+    stmt = lambda_stmt(lambda: _LIST_SELECT)
 
     if account_id:
-        query = query.filter(Transaction.account_id == account_id)
+        stmt += lambda s: s.where(Transaction.account_id == account_id)
 
     if year and month:
-        query = query.filter(
-            and_(
-                extract("year", Transaction.posted_date) == year,
-                extract("month", Transaction.posted_date) == month
-            )
+        # Half-open date range rather than extract() so the posted_date index applies
+        month_start = date(year, month, 1)
+        next_month = date(year + month // 12, month % 12 + 1, 1)
+        stmt += lambda s: s.where(
+            Transaction.posted_date >= month_start,
+            Transaction.posted_date < next_month,
         )
 
     if start_date:
-        query = query.filter(Transaction.posted_date >= start_date)
+        stmt += lambda s: s.where(Transaction.posted_date >= start_date)
     if end_date:
-        query = query.filter(Transaction.posted_date <= end_date)
+        stmt += lambda s: s.where(Transaction.posted_date <= end_date)
     if uncategorized:
-        query = query.filter(Transaction.category_id.is_(None))
+        stmt += lambda s: s.where(Transaction.category_id.is_(None))
     elif category_id:
-        query = query.filter(Transaction.category_id.in_(category_id))
+        stmt += lambda s: s.where(Transaction.category_id.in_(category_id))
     if payee_name:
-        payee_label = func.coalesce(
-            Transaction.display_name,
-            Transaction.payee_normalized,
-            Transaction.payee_raw,
-        )
-        query = query.filter(payee_label == payee_name)
+        stmt += lambda s: s.where(Transaction.display_label == payee_name)
     if payee_search:
-        pattern = f"%{payee_search}%"
-        query = query.filter(
-            or_(
-                Transaction.display_name.ilike(pattern),
-                Transaction.payee_normalized.ilike(pattern),
-                Transaction.payee_raw.ilike(pattern),
+        # Trigram MATCH needs at least three characters; shorter terms scan
+        if has_payee_fts() and len(payee_search) >= 3:
+            phrase = '"' + payee_search.replace('"', '""') + '"'
+            stmt += lambda s: s.where(
+                Transaction.id.in_(
+                    select(_payee_fts.c.rowid).where(
+                        literal_column("tx_payee_fts").op("MATCH")(phrase)
+                    )
+                )
+            )
+        else:
+            pattern = f"%{payee_search}%"
+            stmt += lambda s: s.where(
+                or_(
+                    Transaction.display_name.ilike(pattern),
+                    Transaction.payee_normalized.ilike(pattern),
+                    Transaction.payee_raw.ilike(pattern),
+                )
             )
-        )
     if amount_sign == "positive":
-        query = query.filter(Transaction.amount_cents > 0)
+        stmt += lambda s: s.where(Transaction.amount_cents > 0)
     elif amount_sign == "negative":
-        query = query.filter(Transaction.amount_cents < 0)
+        stmt += lambda s: s.where(Transaction.amount_cents < 0)
     if include_transfers is not None and not include_transfers:
-        query = query.filter(Transaction.transaction_type != TransactionType.TRANSFER)
+        stmt += lambda s: s.where(Transaction.transaction_type != TransactionType.TRANSFER)
+
+    stmt += lambda s: s.order_by(Transaction.posted_date, Transaction.created_at)
+    rows = db.execute(stmt, execution_options={"yield_per": _LIST_CHUNK_SIZE})
 
-    return query.order_by(
-        Transaction.posted_date,
-        Transaction.created_at
-    ).all()
+    # Rows are plain column tuples, so build the JSON payload directly rather
+    # than hydrating ORM objects and validating each through TransactionResponse
+    return ORJSONResponse([row._asdict() for row in rows])
 
 
 @router.get("/balance-before")
@@ -125,28 +153,28 @@ def find_transfer_match(
     db: Session = Depends(get_db)
 ):
     """Find potential matching transactions in the target account for transfer linking."""
-    dest_account = db.query(Account).filter(Account.id == target_account_id).first()
+    dest_account = db.get(Account, target_account_id)
     if not dest_account:
         raise HTTPException(status_code=404, detail="Destination account not found")
 
     window_start = posted_date - timedelta(days=3)
     window_end = posted_date + timedelta(days=3)
 
-    from sqlalchemy import func
     matches = db.query(Transaction).filter(
         Transaction.account_id == target_account_id,
-        func.abs(Transaction.amount_cents) == abs(amount_cents),
+        Transaction.amount_cents_abs == abs(amount_cents),
         Transaction.posted_date >= window_start,
         Transaction.posted_date <= window_end,
         Transaction.transaction_type != TransactionType.TRANSFER,
         Transaction.transfer_link_id.is_(None)
     ).limit(5).all()
 
+    account_name = dest_account.name
     return [
         TransferMatchResponse(
             transaction_id=tx.id,
             account_id=tx.account_id,
-            account_name=dest_account.name,
+            account_name=account_name,
             posted_date=tx.posted_date,
             amount_cents=tx.amount_cents,
             payee_raw=tx.payee_raw,
@@ -160,7 +188,7 @@ def find_transfer_match(
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 def get_transaction(transaction_id: int, db: Session = Depends(get_db)):
     """Get a single transaction by ID."""
-    transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    transaction = db.get(Transaction, transaction_id)
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     return transaction
@@ -174,20 +202,20 @@ def create_transaction(
 ):
     """Create a new transaction."""
     # Verify account exists
-    account = db.query(Account).filter(Account.id == transaction.account_id).first()
+    account = db.get(Account, transaction.account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
     # Delete matched transaction if specified (for transfer linking)
     if delete_match_id and transaction.transfer_to_account_id:
-        match_tx = db.query(Transaction).filter(Transaction.id == delete_match_id).first()
+        match_tx = db.get(Transaction, delete_match_id)
         if match_tx:
             db.delete(match_tx)
             db.flush()
 
     # Handle transfer transactions
     if transaction.transfer_to_account_id:
-        return _create_transfer(transaction, db)
+        return _create_transfer(transaction, db, account)
 
     if transaction.transfer_to_external:
         return _create_external_transfer(transaction, db)
@@ -201,10 +229,15 @@ def create_transaction(
     return db_transaction
 
 
+def _transfer_label(outgoing: bool, account_name: str) -> str:
+    """Payee label for one side of a transfer, e.g. "Transfer to Savings"."""
+    return f"Transfer {'to' if outgoing else 'from'} {account_name}"
+
+
 def _create_external_transfer(transaction: TransactionCreate, db: Session) -> Transaction:
     """Create a transfer to/from an untracked external account (single transaction, no counterpart)."""
     name = transaction.transfer_to_external
-    label = f"Transfer to {name}"
+    label = _transfer_label(True, name)
     tx = Transaction(
         account_id=transaction.account_id,
         posted_date=transaction.posted_date,
@@ -221,51 +254,57 @@ def _create_external_transfer(transaction: TransactionCreate, db: Session) -> Tr
     return tx
 
 
-def _create_transfer(transaction: TransactionCreate, db: Session) -> Transaction:
+def _create_transfer(
+    transaction: TransactionCreate, db: Session, source_account: Account
+) -> Transaction:
     """Create a transfer (two linked transactions)."""
     # Verify destination account exists
-    dest_account = db.query(Account).filter(
-        Account.id == transaction.transfer_to_account_id
-    ).first()
+    dest_account = db.get(Account, transaction.transfer_to_account_id)
     if not dest_account:
         raise HTTPException(status_code=404, detail="Destination account not found")
 
-    # Create outflow transaction (negative amount)
-    source_account = db.query(Account).filter(Account.id == transaction.account_id).first()
-    outflow = Transaction(
-        account_id=transaction.account_id,
+    out_label = _transfer_label(True, dest_account.name)
+    in_label = _transfer_label(False, source_account.name)
+    common = dict(
         posted_date=transaction.posted_date,
-        amount_cents=-abs(transaction.amount_cents),
-        payee_normalized=f"Transfer to {dest_account.name}",
-        display_name=f"Transfer to {dest_account.name}",
         memo=transaction.memo,
         transaction_type=TransactionType.TRANSFER,
-        source=transaction.source
+        source=transaction.source,
     )
-    db.add(outflow)
-    db.flush()
+
+    # Core INSERTs rather than ORM objects: nothing here needs the unit of
+    # work until the outflow is loaded for the response.
+    # Create outflow transaction (negative amount)
+    outflow_id = db.execute(
+        insert(Transaction).values(
+            account_id=transaction.account_id,
+            amount_cents=-abs(transaction.amount_cents),
+            payee_normalized=out_label,
+            display_name=out_label,
+            **common,
+        ).returning(Transaction.id)
+    ).scalar_one()
 
     # Create inflow transaction (positive amount)
-    inflow = Transaction(
-        account_id=transaction.transfer_to_account_id,
-        posted_date=transaction.posted_date,
-        amount_cents=abs(transaction.amount_cents),
-        payee_normalized=f"Transfer from {source_account.name}",
-        display_name=f"Transfer from {source_account.name}",
-        memo=transaction.memo,
-        transaction_type=TransactionType.TRANSFER,
-        source=transaction.source,
-        transfer_link_id=outflow.id
-    )
-    db.add(inflow)
-    db.flush()
+    inflow_id = db.execute(
+        insert(Transaction).values(
+            account_id=transaction.transfer_to_account_id,
+            amount_cents=abs(transaction.amount_cents),
+            payee_normalized=in_label,
+            display_name=in_label,
+            transfer_link_id=outflow_id,
+            **common,
+        ).returning(Transaction.id)
+    ).scalar_one()
 
     # Link outflow to inflow
-    outflow.transfer_link_id = inflow.id
-    db.flush()
-    db.refresh(outflow)
+    db.execute(
+        update(Transaction)
+        .where(Transaction.id == outflow_id)
+        .values(transfer_link_id=inflow_id)
+    )
 
-    return outflow
+    return db.get(Transaction, outflow_id)
 
 
 @router.post("/{transaction_id}/convert-to-transfer", response_model=TransactionResponse)
@@ -275,7 +314,7 @@ def convert_to_transfer(
     db: Session = Depends(get_db)
 ):
     """Convert a regular transaction into a transfer."""
-    tx = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    tx = db.get(Transaction, transaction_id)
     if not tx:
         raise HTTPException(status_code=404, detail="Transaction not found")
     if tx.transaction_type == TransactionType.TRANSFER:
@@ -292,7 +331,7 @@ def convert_to_transfer(
     # External transfer: single transaction, no counterpart
     if request.external_account_name:
         name = request.external_account_name
-        label = f"Transfer {'to' if is_outflow else 'from'} {name}"
+        label = _transfer_label(is_outflow, name)
         tx.transaction_type = TransactionType.TRANSFER
         tx.payee_raw = None
         tx.category_id = None
@@ -302,47 +341,55 @@ def convert_to_transfer(
         db.refresh(tx)
         return tx
 
-    # Internal transfer: create linked counterpart in target account
-    target_account = db.query(Account).filter(Account.id == request.target_account_id).first()
+    # Internal transfer: create linked counterpart in target account.
+    # Both accounts come back from one IN query.
+    accounts = {
+        a.id: a for a in db.query(Account).filter(
+            Account.id.in_([tx.account_id, request.target_account_id])
+        )
+    }
+    target_account = accounts.get(request.target_account_id)
     if not target_account:
         raise HTTPException(status_code=404, detail="Target account not found")
 
-    source_account = db.query(Account).filter(Account.id == tx.account_id).first()
+    source_account = accounts[tx.account_id]
 
-    # Delete matched transaction if specified (duplicate in target account)
+    # Delete matched transaction if specified (duplicate in target account);
+    # the DELETE goes out with the flush below
     if request.delete_match_id:
-        match_tx = db.query(Transaction).filter(Transaction.id == request.delete_match_id).first()
+        match_tx = db.get(Transaction, request.delete_match_id)
         if match_tx:
             db.delete(match_tx)
-            db.flush()
 
     tx.transaction_type = TransactionType.TRANSFER
     tx.payee_raw = None
     tx.category_id = None
 
+    tgt_label = _transfer_label(is_outflow, target_account.name)
+    src_label = _transfer_label(not is_outflow, source_account.name)
+
     if is_outflow:
         tx.amount_cents = -abs(tx.amount_cents)
-        tx.payee_normalized = f"Transfer to {target_account.name}"
-        tx.display_name = f"Transfer to {target_account.name}"
     else:
         tx.amount_cents = abs(tx.amount_cents)
-        tx.payee_normalized = f"Transfer from {target_account.name}"
-        tx.display_name = f"Transfer from {target_account.name}"
-    db.flush()
+    tx.payee_normalized = tgt_label
+    tx.display_name = tgt_label
 
     # Create the linked counterpart (opposite sign)
     linked = Transaction(
         account_id=request.target_account_id,
         posted_date=tx.posted_date,
         amount_cents=-tx.amount_cents,
-        payee_normalized=f"Transfer {'from' if is_outflow else 'to'} {source_account.name}",
-        display_name=f"Transfer {'from' if is_outflow else 'to'} {source_account.name}",
+        payee_normalized=src_label,
+        display_name=src_label,
         memo=tx.memo,
         transaction_type=TransactionType.TRANSFER,
         source=tx.source,
         transfer_link_id=tx.id
     )
     db.add(linked)
+    # One flush writes the delete, the tx changes and the new row, giving
+    # linked its id for the back-reference
     db.flush()
 
     tx.transfer_link_id = linked.id
@@ -364,22 +411,28 @@ def categorize_by_payee(
     if not payee or not category_id or not account_id:
         raise HTTPException(status_code=400, detail="payee, category_id, and account_id are required")
 
-    # Match on payee_raw or display_name
-    from sqlalchemy import or_
-    matches = db.query(Transaction).filter(
-        Transaction.account_id == account_id,
-        Transaction.category_id.is_(None),
-        or_(
-            Transaction.payee_raw == payee,
-            Transaction.display_name == payee
+    # Match on payee_raw or display_name; one UPDATE rather than loading rows
+    result = db.execute(
+        update(Transaction)
+        .where(
+            Transaction.account_id == account_id,
+            Transaction.category_id.is_(None),
+            or_(
+                Transaction.payee_raw == payee,
+                Transaction.display_name == payee
+            )
         )
-    ).all()
+        .values(category_id=category_id)
+        .execution_options(synchronize_session=False)
+    )
+    return {"updated_count": result.rowcount}
 
-    for tx in matches:
-        tx.category_id = category_id
 
-    db.flush()
-    return {"updated_count": len(matches)}
+def _get_with_transfer_link(db: Session, transaction_id: int) -> Transaction | None:
+    """Load a transaction with its linked transfer side in the same query."""
+    return db.get(
+        Transaction, transaction_id, options=[joinedload(Transaction.transfer_link)]
+    )
 
 
 @router.patch("/{transaction_id}", response_model=TransactionResponse)
@@ -389,7 +442,7 @@ def update_transaction(
     db: Session = Depends(get_db)
 ):
     """Update a transaction."""
-    db_transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    db_transaction = _get_with_transfer_link(db, transaction_id)
     if not db_transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
 
@@ -397,9 +450,7 @@ def update_transaction(
 
     # Handle transfer auto-update
     if db_transaction.transfer_link_id and db_transaction.transaction_type == TransactionType.TRANSFER:
-        linked = db.query(Transaction).filter(
-            Transaction.id == db_transaction.transfer_link_id
-        ).first()
+        linked = db_transaction.transfer_link
         if linked:
             # Update linked transaction with mirrored changes
             if "amount_cents" in update_data:
@@ -426,15 +477,13 @@ def update_transaction(
 @router.delete("/{transaction_id}", status_code=204)
 def delete_transaction(transaction_id: int, db: Session = Depends(get_db)):
     """Delete a transaction."""
-    db_transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    db_transaction = _get_with_transfer_link(db, transaction_id)
     if not db_transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
 
     # Delete linked transfer if exists
     if db_transaction.transfer_link_id:
-        linked = db.query(Transaction).filter(
-            Transaction.id == db_transaction.transfer_link_id
-        ).first()
+        linked = db_transaction.transfer_link
         if linked:
             # Break circular reference before deleting
             linked.transfer_link_id = None
@@ -1,8 +1,13 @@
-import json
 import os
+import threading
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from pydantic import BaseModel
-from datetime import datetime
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError, field_validator
+from datetime import datetime, timezone
+
+from . import config_writer
 
 # Config directory — use BUDGET_DATA_DIR env var if set (e.g. /data in Docker),
 # otherwise fall back to ~/.config/budget for local dev
@@ -18,106 +23,183 @@ class RecentBook(BaseModel):
     last_opened: datetime
     last_backup: datetime | None = None
 
+    class Config:
+        # Instances are shared through the recent-books cache; updates go
+        # through model_copy so a failed save can't leave the cache edited
+        frozen = True
+
+    @field_validator("last_opened", "last_backup")
+    @classmethod
+    def _assume_utc(cls, v: datetime | None) -> datetime | None:
+        # Older recent.json files stored naive UTC timestamps
+        if v is not None and v.tzinfo is None:
+            return v.replace(tzinfo=timezone.utc)
+        return v
+
+
+_BOOKS_ADAPTER = TypeAdapter(list[RecentBook])
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@lru_cache(maxsize=128)
+def _resolved_str(path: Path) -> str:
+    """Absolute, symlink-resolved path string used as the recent-books key."""
+    return str(path.resolve())
+
 
 def ensure_config_dir() -> None:
     """Ensure the config directory exists."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_recent_books() -> list[RecentBook]:
-    """Load the list of recently opened books."""
+# Created once at import rather than on every read and save; the writer
+# recreates it if it disappears later
+try:
     ensure_config_dir()
-    if not RECENT_BOOKS_FILE.exists():
-        return []
+except OSError:
+    pass
+
+
+# (recent.json st_mtime_ns, books keyed by path, most recent first); reads
+# skip the file until it changes on disk. Saves update it in place and set
+# the mtime to None until the background write lands, so reads trust memory
+# rather than the stale file in between.
+_recent_cache: tuple[int | None, dict[str, RecentBook]] | None = None
+_recent_cache_lock = threading.Lock()
+# Bumped per save so a finished write only stamps the mtime of its own data
+_recent_save_seq = 0
+
+
+def _load_recent_map() -> dict[str, RecentBook]:
+    """Recent books keyed by resolved path, in most-recent-first order."""
+    global _recent_cache
+    with _recent_cache_lock:
+        if _recent_cache is not None and _recent_cache[0] is None:
+            return dict(_recent_cache[1])
 
     try:
-        with open(RECENT_BOOKS_FILE, "r") as f:
-            data = json.load(f)
-            return [RecentBook(**item) for item in data]
-    except (json.JSONDecodeError, KeyError):
-        return []
+        mtime = RECENT_BOOKS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    with _recent_cache_lock:
+        if _recent_cache is not None and _recent_cache[0] == mtime:
+            return dict(_recent_cache[1])
+
+    try:
+        books = _BOOKS_ADAPTER.validate_json(RECENT_BOOKS_FILE.read_bytes())
+    except ValidationError:
+        return {}
+    by_path: dict[str, RecentBook] = {}
+    for book in books:
+        by_path.setdefault(book.path, book)
+    with _recent_cache_lock:
+        _recent_cache = (mtime, by_path)
+    return dict(by_path)
+
+
+def _save_recent_map(by_path: dict[str, RecentBook]) -> None:
+    """Save the books, keeping only the 10 most recent; the disk write is queued."""
+    global _recent_cache, _recent_save_seq
+    by_path = dict(islice(by_path.items(), 10))
+    # Python-mode dump keeps datetimes as objects for orjson to encode natively
+    data = orjson.dumps(
+        _BOOKS_ADAPTER.dump_python(list(by_path.values())),
+        option=orjson.OPT_INDENT_2,
+    )
+    with _recent_cache_lock:
+        _recent_save_seq += 1
+        seq = _recent_save_seq
+        _recent_cache = (None, by_path)
+
+    def written() -> None:
+        global _recent_cache
+        mtime = RECENT_BOOKS_FILE.stat().st_mtime_ns
+        with _recent_cache_lock:
+            if _recent_save_seq == seq:
+                _recent_cache = (mtime, by_path)
+
+    config_writer.submit(RECENT_BOOKS_FILE, data, written)
+
+
+def load_recent_books() -> list[RecentBook]:
+    """Load the list of recently opened books."""
+    return list(_load_recent_map().values())
 
 
 def save_recent_books(books: list[RecentBook]) -> None:
     """Save the list of recently opened books."""
-    ensure_config_dir()
-    with open(RECENT_BOOKS_FILE, "w") as f:
-        json.dump([book.model_dump(mode="json") for book in books], f, indent=2, default=str)
+    _save_recent_map({b.path: b for b in books})
 
 
 def add_recent_book(path: Path, name: str | None = None) -> None:
     """Add or update a book in the recent books list."""
-    books = load_recent_books()
-    path_str = str(path.resolve())
-
-    # Preserve last_backup from existing entry
-    existing_backup = None
-    for b in books:
-        if b.path == path_str:
-            existing_backup = b.last_backup
-            break
-
-    # Remove if already exists
-    books = [b for b in books if b.path != path_str]
-
-    # Add to front
-    books.insert(0, RecentBook(
+    by_path = _load_recent_map()
+    path_str = _resolved_str(path)
+    name = name or path.stem
+
+    # Reopening the book already at the top moments ago changes nothing
+    # worth rewriting the file for
+    head = next(iter(by_path.values()), None)
+    if (
+        head is not None
+        and head.path == path_str
+        and head.name == name
+        and (_utcnow() - head.last_opened).total_seconds() < 60
+    ):
+        return
+
+    # Move to front, preserving last_backup from the existing entry
+    existing = by_path.pop(path_str, None)
+    book = RecentBook(
         path=path_str,
-        name=name or path.stem,
-        last_opened=datetime.utcnow(),
-        last_backup=existing_backup,
-    ))
-
-    # Keep only last 10
-    books = books[:10]
-
-    save_recent_books(books)
+        name=name,
+        last_opened=_utcnow(),
+        last_backup=existing.last_backup if existing else None,
+    )
+    _save_recent_map({path_str: book, **by_path})
 
 
 def update_backup_timestamp(path: Path) -> None:
     """Update the last_backup timestamp for a book."""
-    books = load_recent_books()
-    path_str = str(path.resolve())
-    for book in books:
-        if book.path == path_str:
-            book.last_backup = datetime.utcnow()
-    save_recent_books(books)
+    by_path = _load_recent_map()
+    path_str = _resolved_str(path)
+    book = by_path.get(path_str)
+    if book is not None:
+        by_path[path_str] = book.model_copy(update={"last_backup": _utcnow()})
+    _save_recent_map(by_path)
 
 
 def get_backup_status(path: Path) -> dict:
     """Get backup status for a book."""
-    books = load_recent_books()
-    path_str = str(path.resolve())
-    for book in books:
-        if book.path == path_str and book.last_backup:
-            days = (datetime.utcnow() - book.last_backup).days
-            return {"last_backup": book.last_backup.isoformat(), "days_since_backup": days}
+    book = _load_recent_map().get(_resolved_str(path))
+    if book is not None and book.last_backup:
+        days = (_utcnow() - book.last_backup).days
+        return {"last_backup": book.last_backup.isoformat(), "days_since_backup": days}
     return {"last_backup": None, "days_since_backup": None}
 
 
 def rename_book(path: Path, new_name: str) -> None:
     """Rename a book in the recent books list."""
-    books = load_recent_books()
-    path_str = str(path.resolve())
-    for book in books:
-        if book.path == path_str:
-            book.name = new_name
-    save_recent_books(books)
+    by_path = _load_recent_map()
+    path_str = _resolved_str(path)
+    book = by_path.get(path_str)
+    if book is not None:
+        by_path[path_str] = book.model_copy(update={"name": new_name})
+    _save_recent_map(by_path)
 
 
 def get_book_name(path: Path) -> str | None:
     """Get the stored display name for a book."""
-    books = load_recent_books()
-    path_str = str(path.resolve())
-    for book in books:
-        if book.path == path_str:
-            return book.name
-    return None
+    book = _load_recent_map().get(_resolved_str(path))
+    return book.name if book is not None else None
 
 
 def remove_recent_book(path: Path) -> None:
     """Remove a book from the recent books list."""
-    books = load_recent_books()
-    path_str = str(path.resolve())
-    books = [b for b in books if b.path != path_str]
-    save_recent_books(books)
+    by_path = _load_recent_map()
+    by_path.pop(_resolved_str(path), None)
+    _save_recent_map(by_path)
@@ -0,0 +1,92 @@
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Callable
+
+# Background writer for small config files (recent.json). Requests update
+# the in-memory state and hand the serialized bytes here, so the disk write
+# and fsync happen off the request path. Only the newest pending payload per
+# file is written.
+
+logger = logging.getLogger(__name__)
+
+_queue: queue.Queue[Path | None] = queue.Queue()
+_pending: dict[Path, tuple[bytes, Callable[[], None] | None]] = {}
+_pending_lock = threading.Lock()
+_thread: threading.Thread | None = None
+_thread_lock = threading.Lock()
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a sibling temp file and rename it over path.
+
+    A crash mid-write can never leave the file truncated.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        f = open(tmp, "wb")
+    except FileNotFoundError:
+        # Directory removed while running; recreate it once
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(tmp, "wb")
+    with f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _run() -> None:
+    while True:
+        path = _queue.get()
+        if path is None:
+            return
+        with _pending_lock:
+            item = _pending.pop(path, None)
+        if item is None:
+            # Already written by an earlier wake-up for the same file
+            continue
+        data, on_written = item
+        try:
+            write_atomic(path, data)
+        except OSError:
+            logger.exception("Failed to write %s", path)
+            continue
+        if on_written is not None:
+            try:
+                on_written()
+            except Exception:
+                # Must not take the writer thread down with it
+                logger.exception("Post-write callback for %s failed", path)
+
+
+def submit(path: Path, data: bytes, on_written: Callable[[], None] | None = None) -> None:
+    """
+    Queue data to be written to path, replacing any write still pending.
+
+    on_written runs on the writer thread once the file is on disk.
+    """
+    global _thread
+    with _thread_lock:
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(
+                target=_run, name="config-writer", daemon=True
+            )
+            _thread.start()
+    with _pending_lock:
+        _pending[path] = (data, on_written)
+    _queue.put(path)
+
+
+def shutdown() -> None:
+    """Write everything still queued, then stop the writer thread."""
+    global _thread
+    with _thread_lock:
+        thread, _thread = _thread, None
+    if thread is None:
+        return
+    _queue.put(None)
+    thread.join()
@@ -1,27 +1,85 @@
+import asyncio
 import hashlib
+import hmac
 import os
 import sqlite3
+import threading
 from datetime import date
 from pathlib import Path
-from sqlalchemy import create_engine, event, text, inspect
+from typing import AsyncIterator
+from sqlalchemy import Column, ForeignKey, create_engine, event, text, inspect
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+)
+from sqlalchemy.schema import CreateTable
 
 from .models import Base
 
 # Global state for current book
 _current_engine: Engine | None = None
 _current_session_factory: sessionmaker | None = None
+_current_async_engine: AsyncEngine | None = None
+_current_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+_current_book_path: Path | None = None
+
+# Bumped whenever a book is opened or closed so process-local caches can key
+# on it and never serve data from a previously open book.
+_book_generation = 0
+
+# Whether the open book has the tx_payee_fts index (needs FTS5 with the
+# trigram tokenizer, SQLite 3.34+)
+_payee_fts_available = False
+
+# Bumped after every commit that wrote to the open book, so caches of derived
+# data (reports) can key on it instead of tracking each write path.
+_data_version = 0
+_data_version_lock = threading.Lock()
 
 
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
-    """Enable foreign keys for SQLite."""
+    """Enable foreign keys and WAL-mode tuning for SQLite."""
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
+    # NORMAL sync is safe in WAL mode (set once per file in open_book) and
+    # avoids an fsync per transaction
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
     cursor.close()
 
 
+@event.listens_for(Session, "after_flush")
+def _mark_flush_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_write(orm_execute_state):
+    # Bulk UPDATE/DELETE and Core INSERTs bypass the flush
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_data_version(session):
+    global _data_version
+    if session.info.pop("wrote", False):
+        # Commits finish on threadpool threads; an unlocked += can lose a
+        # bump and leave a report cached under a version that never moved
+        with _data_version_lock:
+            _data_version += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_write_mark(session):
+    session.info.pop("wrote", None)
+
+
 def open_book(db_path: Path) -> None:
     """
     Open a book (SQLite database file).
@@ -29,27 +87,85 @@ def open_book(db_path: Path) -> None:
     Creates the file and tables if it doesn't exist.
     """
     global _current_engine, _current_session_factory
+    global _current_async_engine, _current_async_session_factory
+    global _current_book_path, _book_generation, _payee_fts_available
 
     if _current_engine is not None:
         close_book()
 
+    _book_generation += 1
+    _current_book_path = db_path
+
     db_url = f"sqlite:///{db_path}"
-    _current_engine = create_engine(db_url, echo=False)
+    _current_engine = create_engine(
+        db_url,
+        echo=False,
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
     _current_session_factory = sessionmaker(bind=_current_engine)
 
-    # Create tables if they don't exist
-    Base.metadata.create_all(_current_engine)
+    # Async engine for the async endpoints. Pooled, so each request reuses a
+    # connection (and its page cache) instead of paying for a new aiosqlite
+    # thread and the connect pragmas every time.
+    _current_async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        echo=False,
+        connect_args={"timeout": 30},
+    )
+    _current_async_session_factory = async_sessionmaker(
+        _current_async_engine, expire_on_commit=False
+    )
+
+    try:
+        _prepare_book(_current_engine)
+    except Exception:
+        # Never leave a half-migrated book installed
+        close_book()
+        raise
+
+
+def _prepare_book(engine: Engine) -> None:
+    """Bring an opened book's schema, indexes and triggers up to date."""
+    global _payee_fts_available
+
+    # The whole startup sequence runs on one connection, so every step sees
+    # the schema the previous one left. Each step commits its own work,
+    # which keeps the foreign_keys pragma toggles outside a transaction.
+    with engine.connect() as conn:
+        # WAL lets readers proceed while a writer commits. The journal mode
+        # is stored in the file, so it only needs setting once per open.
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+
+        # Create tables if they don't exist
+        Base.metadata.create_all(conn)
+        conn.commit()
+
+        # Migrate existing tables: add missing columns
+        _migrate_schema(conn)
+
+        # Rebuild tables whose foreign key actions predate the models
+        _rebuild_stale_foreign_keys(conn)
+
+        # create_all() skips existing tables, so add indexes introduced since
+        _create_missing_indexes(conn)
 
-    # Migrate existing tables: add missing columns
-    _migrate_schema(_current_engine)
+        # Substring index for payee search; after the rebuild above, which
+        # drops the transactions triggers along with the old table
+        _payee_fts_available = _ensure_payee_fts(conn)
 
-    # Clean up stale forecast dismissals
-    _cleanup_old_dismissals(_current_engine)
+        # Report aggregates, kept current by triggers; also after the rebuild
+        _ensure_monthly_summary(conn)
 
+        # Clean up stale forecast dismissals
+        _cleanup_old_dismissals(conn)
 
-def _migrate_schema(engine: Engine) -> None:
+
+def _migrate_schema(conn: Connection) -> None:
     """Add any missing columns to existing tables."""
-    inspector = inspect(engine)
 
     # Define expected columns that may be missing from older databases
     # Format: (table_name, column_name, column_type_sql)
@@ -58,36 +174,352 @@ def _migrate_schema(engine: Engine) -> None:
         ("transactions", "external_id", "VARCHAR(255)"),
         ("accounts", "show_running_balance", "BOOLEAN DEFAULT 1"),
         ("recurring_templates", "payee_id", "INTEGER REFERENCES payees(id)"),
+        (
+            "transactions", "display_label",
+            "VARCHAR(500) GENERATED ALWAYS AS "
+            "(coalesce(display_name, payee_normalized, payee_raw)) VIRTUAL",
+        ),
+        (
+            "transactions", "amount_cents_abs",
+            "INTEGER GENERATED ALWAYS AS (abs(amount_cents)) VIRTUAL",
+        ),
     ]
 
-    with engine.connect() as conn:
-        for table, column, col_type in migrations:
-            if not inspector.has_table(table):
-                continue
-            existing = [c["name"] for c in inspector.get_columns(table)]
-            if column not in existing:
+    # Read each table's column names once straight from SQLite; missing
+    # tables are skipped
+    existing_tables = {
+        row[0] for row in conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        )
+    }
+    cols_by_table: dict[str, set[str]] = {}
+    for table in dict.fromkeys(t for t, _, _ in migrations):
+        if table in existing_tables:
+            cols_by_table[table] = {
+                row[1] for row in conn.exec_driver_sql(f"PRAGMA table_xinfo({table})")
+            }
+
+    pending = []
+    for table, column, col_type in migrations:
+        existing = cols_by_table.get(table)
+        if existing is None or column in existing:
+            continue
+        pending.append((table, column, col_type))
+        existing.add(column)
+    if not pending:
+        return
+
+    # Foreign key columns go through Alembic's batch mode, which rebuilds the
+    # table with the constraint as the model declares it. Plain columns are a
+    # bare ADD COLUMN.
+    rebuild = any("REFERENCES" in col_type for _, _, col_type in pending)
+
+    if rebuild:
+        from alembic.migration import MigrationContext
+        from alembic.operations import Operations
+
+        ops = Operations(MigrationContext.configure(conn))
+        # Dropping the old copy must not cascade or trip references to it
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+    try:
+        # All changes share one transaction, so one commit. pysqlite would
+        # let the batch rebuild's CREATE TABLE commit on its own, so begin
+        # explicitly.
+        conn.exec_driver_sql("BEGIN")
+        for table, column, col_type in pending:
+            if "REFERENCES" in col_type:
+                model_column = Base.metadata.tables[table].c[column]
+                fk = next(iter(model_column.foreign_keys))
+                with ops.batch_alter_table(table, recreate="always") as batch:
+                    batch.add_column(Column(
+                        column,
+                        model_column.type,
+                        ForeignKey(fk.target_fullname, ondelete=fk.ondelete),
+                    ))
+            else:
                 conn.execute(text(
                     f"ALTER TABLE {table} ADD COLUMN {column} {col_type}"
                 ))
-                conn.commit()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        if rebuild:
+            conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+
+def _create_missing_indexes(conn: Connection) -> None:
+    """Create any model indexes missing from existing tables."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    conn.commit()
+
+
+def _rebuild_stale_foreign_keys(conn: Connection) -> None:
+    """
+    Recreate tables whose foreign key ON DELETE actions differ from the models.
+
+    SQLite cannot alter a constraint in place, so the table is recreated
+    under a temporary name, the rows are copied across and the copy is
+    renamed over the original.
+    """
+    existing_tables = {
+        row[0] for row in conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        )
+    }
+
+    stale = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        # (column, referred table) -> ON DELETE action as stored in the file
+        actual = {
+            (row[3], row[2]): row[6].upper()
+            for row in conn.exec_driver_sql(
+                f"PRAGMA foreign_key_list({table.name})"
+            )
+        }
+        for fk in table.foreign_keys:
+            key = (fk.parent.name, fk.column.table.name)
+            expected = (fk.ondelete or "NO ACTION").upper()
+            if key in actual and actual[key] != expected:
+                stale.append(table)
+                break
+
+    if not stale:
+        return
+
+    conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+    try:
+        # pysqlite only opens a transaction before DML, so the CREATE TABLE
+        # would otherwise commit on its own; begin explicitly so a failure
+        # part-way leaves the file as it was
+        conn.exec_driver_sql("BEGIN")
+        for table in stale:
+            tmp_name = f"_{table.name}_rebuild"
+            # Leftover from a rebuild interrupted before this was atomic
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {tmp_name}")
+            existing_columns = {
+                row[1] for row in conn.exec_driver_sql(
+                    f"PRAGMA table_info({table.name})"
+                )
+            }
+            columns = ", ".join(
+                c.name for c in table.columns
+                if c.name in existing_columns and c.computed is None
+            )
+            ddl = str(CreateTable(table).compile(conn)).replace(
+                f"CREATE TABLE {table.name} (",
+                f"CREATE TABLE {tmp_name} (",
+                1,
+            )
+            conn.exec_driver_sql(ddl)
+            conn.exec_driver_sql(
+                f"INSERT INTO {tmp_name} ({columns}) "
+                f"SELECT {columns} FROM {table.name}"
+            )
+            conn.exec_driver_sql(f"DROP TABLE {table.name}")
+            conn.exec_driver_sql(
+                f"ALTER TABLE {tmp_name} RENAME TO {table.name}"
+            )
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+
+# External-content FTS5 table over the payee columns of transactions, kept in
+# sync by triggers. The trigram tokenizer makes MATCH a substring search, the
+# same semantics as the ILIKE '%term%' it replaces.
+_PAYEE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tx_payee_fts USING fts5(
+        payee_raw, payee_normalized, display_name,
+        content='transactions', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tx_payee_fts_ai AFTER INSERT ON transactions BEGIN
+        INSERT INTO tx_payee_fts(rowid, payee_raw, payee_normalized, display_name)
+        VALUES (new.id, new.payee_raw, new.payee_normalized, new.display_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tx_payee_fts_ad AFTER DELETE ON transactions BEGIN
+        INSERT INTO tx_payee_fts(tx_payee_fts, rowid, payee_raw, payee_normalized, display_name)
+        VALUES ('delete', old.id, old.payee_raw, old.payee_normalized, old.display_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tx_payee_fts_au
+    AFTER UPDATE OF payee_raw, payee_normalized, display_name ON transactions BEGIN
+        INSERT INTO tx_payee_fts(tx_payee_fts, rowid, payee_raw, payee_normalized, display_name)
+        VALUES ('delete', old.id, old.payee_raw, old.payee_normalized, old.display_name);
+        INSERT INTO tx_payee_fts(rowid, payee_raw, payee_normalized, display_name)
+        VALUES (new.id, new.payee_raw, new.payee_normalized, new.display_name);
+    END
+    """,
+]
+
+
+def _ensure_payee_fts(conn: Connection) -> bool:
+    """
+    Create the payee search index and its triggers if missing.
+
+    Returns False when this SQLite build lacks FTS5 or the trigram tokenizer,
+    in which case payee search falls back to LIKE.
+    """
+    try:
+        existed = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='tx_payee_fts'"
+        ).first() is not None
+        for ddl in _PAYEE_FTS_DDL:
+            conn.exec_driver_sql(ddl)
+        if not existed:
+            # Index the rows that predate the table
+            conn.exec_driver_sql(
+                "INSERT INTO tx_payee_fts(tx_payee_fts) VALUES ('rebuild')"
+            )
+        conn.commit()
+    except OperationalError:
+        conn.rollback()
+        return False
+    return True
+
+
+# Adds (sign "") or removes (sign "-") one transaction row's contribution to
+# monthly_summary. Only the types the reports read are tracked.
+_MONTHLY_SUMMARY_DELTA = """
+        INSERT INTO monthly_summary (
+            account_id, year, month, category_id, payee_label, transaction_type,
+            income_cents, expense_cents, transaction_count
+        )
+        SELECT
+            {row}.account_id,
+            CAST(strftime('%Y', {row}.posted_date) AS INTEGER),
+            CAST(strftime('%m', {row}.posted_date) AS INTEGER),
+            coalesce({row}.category_id, 0),
+            coalesce({row}.display_name, {row}.payee_normalized, {row}.payee_raw, 'Unknown'),
+            {row}.transaction_type,
+            {sign}max({row}.amount_cents, 0),
+            {sign}max(-{row}.amount_cents, 0),
+            {sign}1
+        WHERE {row}.transaction_type IN ('ACTUAL', 'TRANSFER')
+        ON CONFLICT (account_id, year, month, category_id, payee_label, transaction_type)
+        DO UPDATE SET
+            income_cents = income_cents + excluded.income_cents,
+            expense_cents = expense_cents + excluded.expense_cents,
+            transaction_count = transaction_count + excluded.transaction_count;
+"""
+
+_MONTHLY_SUMMARY_PRUNE = """
+        DELETE FROM monthly_summary
+        WHERE account_id = old.account_id AND transaction_count = 0;
+"""
+
+_MONTHLY_SUMMARY_TRIGGERS = {
+    "monthly_summary_ai": (
+        "AFTER INSERT ON transactions",
+        _MONTHLY_SUMMARY_DELTA.format(row="new", sign=""),
+    ),
+    "monthly_summary_ad": (
+        "AFTER DELETE ON transactions",
+        _MONTHLY_SUMMARY_DELTA.format(row="old", sign="-") + _MONTHLY_SUMMARY_PRUNE,
+    ),
+    "monthly_summary_au": (
+        "AFTER UPDATE OF account_id, posted_date, amount_cents, category_id, "
+        "payee_raw, payee_normalized, display_name, transaction_type ON transactions",
+        _MONTHLY_SUMMARY_DELTA.format(row="old", sign="-")
+        + _MONTHLY_SUMMARY_DELTA.format(row="new", sign="")
+        + _MONTHLY_SUMMARY_PRUNE,
+    ),
+}
+
+_MONTHLY_SUMMARY_BACKFILL = """
+    INSERT INTO monthly_summary (
+        account_id, year, month, category_id, payee_label, transaction_type,
+        income_cents, expense_cents, transaction_count
+    )
+    SELECT
+        account_id,
+        CAST(strftime('%Y', posted_date) AS INTEGER),
+        CAST(strftime('%m', posted_date) AS INTEGER),
+        coalesce(category_id, 0),
+        coalesce(display_name, payee_normalized, payee_raw, 'Unknown'),
+        transaction_type,
+        sum(max(amount_cents, 0)),
+        sum(max(-amount_cents, 0)),
+        count(*)
+    FROM transactions
+    WHERE transaction_type IN ('ACTUAL', 'TRANSFER')
+    GROUP BY 1, 2, 3, 4, 5, 6
+"""
+
+
+def _ensure_monthly_summary(conn: Connection) -> None:
+    """
+    Install the triggers that keep monthly_summary current.
+
+    If any trigger is missing (new book, or the transactions table was just
+    rebuilt) the summary may have missed writes, so it is recomputed.
+    """
+    existing = {
+        name for (name,) in conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master "
+            "WHERE type='trigger' AND tbl_name='transactions'"
+        )
+    }
+    if existing.issuperset(_MONTHLY_SUMMARY_TRIGGERS):
+        conn.rollback()
+        return
+    for name, (timing, body) in _MONTHLY_SUMMARY_TRIGGERS.items():
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+        conn.exec_driver_sql(f"CREATE TRIGGER {name} {timing} BEGIN{body}END")
+    conn.exec_driver_sql("DELETE FROM monthly_summary")
+    conn.exec_driver_sql(_MONTHLY_SUMMARY_BACKFILL)
+    conn.commit()
 
 
-def _cleanup_old_dismissals(engine: Engine) -> None:
+def _cleanup_old_dismissals(conn: Connection) -> None:
     """Delete forecast dismissals for months before the current month."""
-    inspector = inspect(engine)
+    inspector = inspect(conn)
     if not inspector.has_table("forecast_dismissals"):
         return
     current_month = date.today().replace(day=1).isoformat()
-    with engine.connect() as conn:
-        conn.execute(text(
-            f"DELETE FROM forecast_dismissals WHERE period_date < '{current_month}'"
-        ))
-        conn.commit()
+    conn.execute(
+        text("DELETE FROM forecast_dismissals WHERE period_date < :cutoff"),
+        {"cutoff": current_month},
+    )
+    conn.commit()
 
 
 def close_book() -> None:
-    """Close the current book."""
+    """
+    Close the current book.
+
+    Must not be called on the event loop thread: pooled async connections
+    are closed on a short-lived loop of their own.
+    """
     global _current_engine, _current_session_factory
+    global _current_async_engine, _current_async_session_factory
+    global _current_book_path, _book_generation, _payee_fts_available
+
+    _book_generation += 1
+    _current_book_path = None
+    _payee_fts_available = False
+
+    if _current_async_engine is not None:
+        # aiosqlite connections can only be closed by awaiting them
+        asyncio.run(_current_async_engine.dispose())
+        _current_async_engine = None
+        _current_async_session_factory = None
 
     if _current_engine is not None:
         _current_engine.dispose()
@@ -115,6 +547,44 @@ def get_db():
         session.close()
 
 
+def get_async_session() -> AsyncSession:
+    """Get an async database session for the current book."""
+    if _current_async_session_factory is None:
+        raise RuntimeError("No book is currently open")
+    return _current_async_session_factory()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency for async database sessions.
+
+    The whole request runs in one explicit transaction: a single COMMIT on
+    success, rolled back if the handler raises.
+    """
+    async with get_async_session() as session, session.begin():
+        yield session
+
+
+def get_book_generation() -> int:
+    """Counter that changes every time a book is opened or closed."""
+    return _book_generation
+
+
+def has_payee_fts() -> bool:
+    """Whether the open book has the FTS5 payee search index."""
+    return _payee_fts_available
+
+
+def get_data_version() -> int:
+    """Counter that changes after every committed write to the open book."""
+    return _data_version
+
+
+def on_commit(session: Session, callback) -> None:
+    """Run callback once, after the session's current transaction commits."""
+    event.listen(session, "after_commit", lambda _session: callback(), once=True)
+
+
 def is_book_open() -> bool:
     """Check if a book is currently open."""
     return _current_engine is not None
@@ -122,30 +592,68 @@ def is_book_open() -> bool:
 
 def get_current_book_path() -> Path | None:
     """Get the path of the currently open book."""
-    if _current_engine is None:
-        return None
-    # Extract path from SQLite URL
-    url = str(_current_engine.url)
-    if url.startswith("sqlite:///"):
-        return Path(url[10:])
-    return None
+    return _current_book_path
+
+
+# scrypt cost parameters (~16 MiB, tens of milliseconds per hash). Stored
+# salts carry a "scrypt$" prefix; bare hex salts are legacy salted SHA-256.
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+_SCRYPT_PREFIX = "scrypt$"
+
+
+def _scrypt(password: str, salt: bytes) -> bytes:
+    return hashlib.scrypt(
+        password.encode("utf-8"), salt=salt,
+        n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=32,
+    )
 
 
 def hash_password(password: str) -> tuple[str, str]:
-    """Hash a password with a random salt. Returns (hex_hash, hex_salt)."""
-    salt = os.urandom(32)
-    h = hashlib.sha256(salt + password.encode("utf-8")).hexdigest()
-    return h, salt.hex()
+    """Hash a password with a random salt. Returns (hex_hash, salt)."""
+    salt = os.urandom(16)
+    return _scrypt(password, salt).hex(), _SCRYPT_PREFIX + salt.hex()
 
 
 def verify_password(password: str, salt_hex: str, hash_hex: str) -> bool:
     """Verify a password against a stored salt and hash."""
-    salt = bytes.fromhex(salt_hex)
-    h = hashlib.sha256(salt + password.encode("utf-8")).hexdigest()
-    return h == hash_hex
+    if salt_hex.startswith(_SCRYPT_PREFIX):
+        salt = bytes.fromhex(salt_hex[len(_SCRYPT_PREFIX):])
+        h = _scrypt(password, salt).hex()
+    else:
+        # Books created before the switch to scrypt
+        salt = bytes.fromhex(salt_hex)
+        h = hashlib.sha256(salt + password.encode("utf-8")).hexdigest()
+    return hmac.compare_digest(h, hash_hex)
+
+
+# path -> ((st_mtime_ns, st_size), has_password). The status endpoint is
+# polled, so only reopen the file when it has changed on disk.
+_password_cache: dict[str, tuple[tuple[int, int], bool]] = {}
+
+
+def invalidate_password_cache(db_path: Path | None = None) -> None:
+    """Forget cached password state for one book, or for all books."""
+    if db_path is None:
+        _password_cache.clear()
+    else:
+        _password_cache.pop(str(db_path), None)
 
 
 def check_book_has_password(db_path: Path) -> bool:
+    """Check if a book file has a password set (cached on file mtime/size)."""
+    st = os.stat(db_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _password_cache.get(str(db_path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    has_password = _read_book_has_password(db_path)
+    _password_cache[str(db_path)] = (stamp, has_password)
+    return has_password
+
+
+def _read_book_has_password(db_path: Path) -> bool:
     """Check if a book file has a password set (raw sqlite3, no engine needed)."""
     conn = sqlite3.connect(str(db_path))
     try:
@@ -1,12 +1,15 @@
+import asyncio
 import webbrowser
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response
 from pathlib import Path
 
+from . import config_writer
 from .api import api_router
 from .database import close_book
 
@@ -15,15 +18,18 @@ from .database import close_book
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
     yield
-    # Cleanup on shutdown
-    close_book()
+    # Cleanup on shutdown; close_book() runs its own loop to dispose the
+    # async engine, so keep it off this one
+    await asyncio.to_thread(close_book)
+    config_writer.shutdown()
 
 
 app = FastAPI(
     title="Personal Finance Ledger",
     description="Local-first personal finance application",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS for local development
@@ -35,6 +41,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (import previews, payee and transaction lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # API routes
 app.include_router(api_router, prefix="/api")
 
@@ -45,15 +54,42 @@ def health_check():
     return {"status": "ok"}
 
 
+class ImmutableStaticFiles(StaticFiles):
+    """Static files with content-hashed names (Vite's assets/), cacheable forever."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 # Serve frontend static files in production (must be last — catches all unmatched routes)
 frontend_dist = Path(__file__).parent.parent.parent / "frontend" / "dist"
 if frontend_dist.exists():
-    app.mount("/assets", StaticFiles(directory=frontend_dist / "assets"), name="static-assets")
+    app.mount("/assets", ImmutableStaticFiles(directory=frontend_dist / "assets"), name="static-assets")
+
+    # index.html is read once; it references the hashed assets, so clients
+    # must revalidate it to pick up a new build
+    _index_html = (frontend_dist / "index.html").read_bytes()
+
+    # Every file in the build (favicon, manifest, assets, ...), listed
+    # once so client-side routes resolve to index.html without a stat. An
+    # unexpectedly large tree falls back to checking the filesystem.
+    _spa_files: set[str] | None = set()
+    for _p in frontend_dist.rglob("*"):
+        if _p.is_file():
+            _spa_files.add(_p.relative_to(frontend_dist).as_posix())
+            if len(_spa_files) > 10_000:
+                _spa_files = None
+                break
 
     @app.get("/{full_path:path}")
     async def serve_spa(request: Request, full_path: str):
         """Serve index.html for all non-API routes (SPA fallback)."""
-        file_path = frontend_dist / full_path
-        if file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(frontend_dist / "index.html")
+        if _spa_files is None:
+            file_path = frontend_dist / full_path
+            if file_path.is_file():
+                return FileResponse(file_path)
+        elif full_path in _spa_files:
+            return FileResponse(frontend_dist / full_path)
+        return HTMLResponse(_index_html, headers={"Cache-Control": "no-cache"})
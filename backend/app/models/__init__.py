@@ -9,6 +9,7 @@ from .payee import Payee
 from .forecast_dismissal import ForecastDismissal
 from .budget import Budget, BudgetItem, BudgetAccount
 from .book_settings import BookSettings
+from .monthly_summary import MonthlySummary
 
 __all__ = [
     "Base",
@@ -29,4 +30,5 @@ __all__ = [
     "BudgetItem",
     "BudgetAccount",
     "BookSettings",
+    "MonthlySummary",
 ]
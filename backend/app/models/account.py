@@ -25,14 +25,18 @@ class Account(Base, TimestampMixin):
     show_running_balance: Mapped[bool] = mapped_column(Boolean, default=True, server_default="1")
 
     # Relationships
+    # A whole ledger is never wanted as a side effect of touching an account;
+    # query transactions explicitly. Deletes cascade in the database.
     transactions: Mapped[list["Transaction"]] = relationship(
-        "Transaction", back_populates="account", cascade="all, delete-orphan"
+        "Transaction", back_populates="account", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise",
     )
     recurring_templates: Mapped[list["RecurringTemplate"]] = relationship(
         "RecurringTemplate", back_populates="account", cascade="all, delete-orphan"
     )
     import_profiles: Mapped[list["ImportProfile"]] = relationship(
-        "ImportProfile", back_populates="account", cascade="all, delete-orphan"
+        "ImportProfile", back_populates="account", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -1,9 +1,10 @@
 from datetime import datetime
 from sqlalchemy import DateTime
+from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
-class Base(DeclarativeBase):
+class Base(AsyncAttrs, DeclarativeBase):
     """Base class for all models."""
     pass
 
@@ -13,14 +13,22 @@ class Budget(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default="1")
 
-    # Relationships
+    # Relationships; always eager-loaded by BudgetService, so an unplanned
+    # lazy load (one query per budget) raises instead
     items: Mapped[list["BudgetItem"]] = relationship(
-        "BudgetItem", back_populates="budget", cascade="all, delete-orphan"
+        "BudgetItem", back_populates="budget", cascade="all, delete-orphan",
+        lazy="raise",
     )
     accounts: Mapped[list["BudgetAccount"]] = relationship(
-        "BudgetAccount", back_populates="budget", cascade="all, delete-orphan"
+        "BudgetAccount", back_populates="budget", cascade="all, delete-orphan",
+        lazy="raise",
     )
 
+    @property
+    def account_ids(self) -> list[int]:
+        """IDs of the accounts this budget is scoped to."""
+        return [ba.account_id for ba in self.accounts]
+
     def __repr__(self) -> str:
         return f"<Budget(id={self.id}, name='{self.name}')>"
 
@@ -62,7 +70,7 @@ class BudgetAccount(Base):
         Integer, ForeignKey("budgets.id", ondelete="CASCADE"), primary_key=True
     )
     account_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("accounts.id"), primary_key=True
+        Integer, ForeignKey("accounts.id", ondelete="CASCADE"), primary_key=True
     )
 
     # Relationships
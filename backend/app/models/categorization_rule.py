@@ -45,7 +45,7 @@ class CategorizationRule(Base, TimestampMixin):
 
     # Optional: limit rule to specific account
     account_id: Mapped[int | None] = mapped_column(
-        Integer, ForeignKey("accounts.id"), nullable=True
+        Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=True
     )
 
     # Description for UI
@@ -1,5 +1,5 @@
 from datetime import date
-from sqlalchemy import Integer, Date, ForeignKey, UniqueConstraint
+from sqlalchemy import Integer, Date, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin
@@ -16,6 +16,8 @@ class ForecastDismissal(Base, TimestampMixin):
     __tablename__ = "forecast_dismissals"
     __table_args__ = (
         UniqueConstraint("payee_id", "account_id", "period_date"),
+        # Forecast generation loads an account's dismissals for a month range
+        Index("ix_forecast_dismissals_account_period", "account_id", "period_date"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -23,6 +25,6 @@ class ForecastDismissal(Base, TimestampMixin):
         Integer, ForeignKey("payees.id"), nullable=False
     )
     account_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("accounts.id"), nullable=False
+        Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False
     )
-    period_date: Mapped[date] = mapped_column(Date, nullable=False)
+    period_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
@@ -17,7 +17,7 @@ class ImportProfile(Base, TimestampMixin):
 
     # Which account this profile is for
     account_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("accounts.id"), nullable=False
+        Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False
     )
 
     # Profile identification
@@ -0,0 +1,36 @@
+from sqlalchemy import Integer, String, Enum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from .transaction import TransactionType
+
+
+class MonthlySummary(Base):
+    """
+    Pre-aggregated actual/transfer totals for the spending reports.
+
+    One row per account, month, category, payee label and transaction type.
+    Maintained by triggers on the transactions table (see database.py), so
+    it is never written through the ORM. Uncategorized rows use category_id 0
+    so the primary key can serve as the upsert conflict target.
+    """
+
+    __tablename__ = "monthly_summary"
+
+    account_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    month: Mapped[int] = mapped_column(Integer, primary_key=True)
+    category_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    payee_label: Mapped[str] = mapped_column(String(500), primary_key=True)
+    transaction_type: Mapped[TransactionType] = mapped_column(
+        Enum(TransactionType), primary_key=True
+    )
+    income_cents: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    expense_cents: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    transaction_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<MonthlySummary(account={self.account_id}, {self.year}-{self.month:02d}, "
+            f"category={self.category_id}, payee='{self.payee_label}')>"
+        )
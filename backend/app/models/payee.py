@@ -29,6 +29,11 @@ class Payee(Base, TimestampMixin):
 
     # Relationships
     default_category: Mapped["Category | None"] = relationship("Category")
+    recurring_templates: Mapped[list["RecurringTemplate"]] = relationship(
+        "RecurringTemplate", back_populates="payee_rel",
+        order_by="RecurringTemplate.id",
+        cascade="all, delete-orphan", passive_deletes=True,
+    )
 
     def __repr__(self) -> str:
         return f"<Payee(id={self.id}, name='{self.name}')>"
@@ -39,7 +39,7 @@ class RecurringTemplate(Base, TimestampMixin):
 
     # Link to payee (managed from payee rules UI)
     payee_id: Mapped[int | None] = mapped_column(
-        Integer, ForeignKey("payees.id"), nullable=True
+        Integer, ForeignKey("payees.id", ondelete="CASCADE"), nullable=True
     )
 
     # Description
@@ -77,7 +77,9 @@ class RecurringTemplate(Base, TimestampMixin):
     account: Mapped["Account"] = relationship(
         "Account", back_populates="recurring_templates"
     )
-    payee_rel: Mapped["Payee | None"] = relationship("Payee")
+    payee_rel: Mapped["Payee | None"] = relationship(
+        "Payee", back_populates="recurring_templates"
+    )
     category: Mapped["Category | None"] = relationship("Category")
     transactions: Mapped[list["Transaction"]] = relationship(
         "Transaction", back_populates="recurring_template"
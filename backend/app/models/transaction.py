@@ -1,6 +1,7 @@
 import enum
 from datetime import date
-from sqlalchemy import String, Integer, Date, ForeignKey, Enum, Boolean
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import String, Integer, Date, ForeignKey, Enum, Boolean, Index, Computed, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -36,15 +37,26 @@ class Transaction(Base, TimestampMixin):
 
     # Core fields
     account_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("accounts.id"), nullable=False, index=True
+        Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False
     )
     posted_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     amount_cents: Mapped[int] = mapped_column(Integer, nullable=False)  # Stored as cents
+    # Magnitude for sign-agnostic matching; virtual so it can be added in place
+    amount_cents_abs: Mapped[int] = mapped_column(
+        Integer, Computed("abs(amount_cents)", persisted=False)
+    )
 
     # Payee information
-    payee_raw: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    payee_raw: Mapped[str | None] = mapped_column(String(500), nullable=True, index=True)
     payee_normalized: Mapped[str | None] = mapped_column(String(255), nullable=True)
     display_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Label shown for the payee; a virtual generated column so it can be
+    # indexed for report drill-downs without extra bookkeeping on writes
+    display_label: Mapped[str | None] = mapped_column(
+        String(500),
+        Computed("coalesce(display_name, payee_normalized, payee_raw)", persisted=False),
+        index=True,
+    )
 
     # Additional details
     memo: Mapped[str | None] = mapped_column(String(1000), nullable=True)
@@ -69,7 +81,7 @@ class Transaction(Base, TimestampMixin):
 
     # Transfer linking - if this is a transfer, link to the other side
     transfer_link_id: Mapped[int | None] = mapped_column(
-        Integer, ForeignKey("transactions.id"), nullable=True
+        Integer, ForeignKey("transactions.id", ondelete="SET NULL"), nullable=True
     )
 
     # Forecast fulfillment - link from forecast to actual that fulfilled it
@@ -98,13 +110,46 @@ class Transaction(Base, TimestampMixin):
         """Get amount as decimal dollars."""
         return self.amount_cents / 100.0
 
-    @amount.setter
-    def amount(self, value: float) -> None:
-        """Set amount from decimal dollars."""
-        self.amount_cents = int(round(value * 100))
+    def set_amount_from_decimal(self, value: Decimal) -> None:
+        """Set amount from dollars, rounding half-cents away from zero."""
+        self.amount_cents = int((value * 100).to_integral_value(ROUND_HALF_UP))
 
     def __repr__(self) -> str:
         return (
             f"<Transaction(id={self.id}, date={self.posted_date}, "
             f"amount=${self.amount:.2f}, payee='{self.payee_normalized or self.payee_raw}')>"
         )
+
+
+# Per-account register queries filter by account and a posted_date range.
+# Also serves plain account_id lookups, so account_id has no index of its own.
+Index("ix_tx_account_date", Transaction.account_id, Transaction.posted_date)
+
+# Category drill-downs and budget actuals filter by category within a range
+Index("ix_tx_category_date", Transaction.category_id, Transaction.posted_date)
+
+# Transfer matching looks up a magnitude within one account and date window
+Index(
+    "ix_tx_abs",
+    Transaction.account_id,
+    Transaction.amount_cents_abs,
+    Transaction.posted_date,
+)
+
+# Serves "latest transaction for this payee" lookups straight from the index
+# instead of sorting every matching row.
+Index(
+    "ix_tx_displayname_date",
+    Transaction.display_name,
+    Transaction.posted_date.desc(),
+    Transaction.created_at.desc(),
+)
+
+# Transfer matching only considers unlinked, non-transfer rows, so index just
+# those. Enum columns store member names, hence 'TRANSFER'.
+Index(
+    "ix_tx_unlinked",
+    Transaction.account_id,
+    Transaction.posted_date,
+    sqlite_where=text("transfer_link_id IS NULL AND transaction_type != 'TRANSFER'"),
+)
@@ -1,6 +1,8 @@
 from datetime import datetime
 from pydantic import BaseModel
 
+from .base import FastORMMixin
+
 
 class AccountBase(BaseModel):
     """Base account fields."""
@@ -27,7 +29,7 @@ class AccountUpdate(BaseModel):
     show_running_balance: bool | None = None
 
 
-class AccountResponse(AccountBase):
+class AccountResponse(FastORMMixin, AccountBase):
     """Account response with all fields."""
     id: int
     created_at: datetime
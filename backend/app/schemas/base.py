@@ -0,0 +1,27 @@
+from typing import Any
+
+
+class FastORMMixin:
+    """
+    Adds from_orm_fast() to response schemas built from ORM rows.
+
+    Rows read back from our own database are already well-typed, so the
+    list endpoints copy attributes straight into the model with
+    model_construct() instead of running full validation per row.
+    """
+
+    _orm_field_names = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        # Runs once model_fields is complete; cache the names so each
+        # conversion doesn't rebuild the field list
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._orm_field_names = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """Build the schema from obj's attributes without validating them."""
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls._orm_field_names}
+        )
@@ -2,6 +2,8 @@ from __future__ import annotations
 from datetime import datetime, date
 from pydantic import BaseModel
 
+from .base import FastORMMixin
+
 
 # --- Input schemas ---
 
@@ -31,7 +33,7 @@ class AutoPopulateRequest(BaseModel):
 
 # --- Response schemas ---
 
-class BudgetItemResponse(BaseModel):
+class BudgetItemResponse(FastORMMixin, BaseModel):
     id: int
     category_id: int
     amount_cents: int
@@ -40,7 +42,7 @@ class BudgetItemResponse(BaseModel):
         from_attributes = True
 
 
-class BudgetResponse(BaseModel):
+class BudgetResponse(FastORMMixin, BaseModel):
     id: int
     name: str
     is_active: bool
@@ -49,6 +51,22 @@ class BudgetResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> BudgetResponse:
+        """Construct without validation, converting the nested items too."""
+        return cls.model_construct(
+            id=obj.id,
+            name=obj.name,
+            is_active=obj.is_active,
+            account_ids=obj.account_ids,
+            items=[BudgetItemResponse.from_orm_fast(i) for i in obj.items],
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+        )
+
+    class Config:
+        from_attributes = True
+
 
 # --- Budget vs Actual schemas ---
 
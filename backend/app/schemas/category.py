@@ -1,6 +1,8 @@
 from datetime import datetime
 from pydantic import BaseModel
 
+from .base import FastORMMixin
+
 
 class CategoryBase(BaseModel):
     """Base category fields."""
@@ -21,7 +23,7 @@ class CategoryUpdate(BaseModel):
     display_order: int | None = None
 
 
-class CategoryResponse(CategoryBase):
+class CategoryResponse(FastORMMixin, CategoryBase):
     """Category response with all fields."""
     id: int
     created_at: datetime
@@ -47,7 +47,8 @@ class ParsedTransactionResponse(BaseModel):
 
     @classmethod
     def from_parsed(cls, tx):
-        return cls(
+        # Built from parser output, which is already well-typed; skip validation
+        return cls.model_construct(
             row_index=tx.row_index,
             posted_date=tx.posted_date,
             amount_cents=tx.amount_cents,
@@ -76,6 +77,21 @@ class DuplicateResponse(BaseModel):
     existing: ExistingTransactionInfo
     fingerprint: str
 
+    @classmethod
+    def from_duplicate(cls, dup):
+        existing = dup.existing_tx
+        return cls.model_construct(
+            parsed=ParsedTransactionResponse.from_parsed(dup.parsed_tx),
+            existing=ExistingTransactionInfo.model_construct(
+                id=existing.id,
+                posted_date=existing.posted_date,
+                amount_cents=existing.amount_cents,
+                payee_raw=existing.payee_raw,
+                memo=existing.memo
+            ),
+            fingerprint=dup.fingerprint
+        )
+
 
 class CSVPreviewResponse(BaseModel):
     """Response from CSV preview."""
@@ -1,5 +1,6 @@
-from datetime import datetime
-from pydantic import BaseModel
+import enum
+from datetime import date, datetime
+from pydantic import BaseModel, field_validator
 
 
 class MatchPattern(BaseModel):
@@ -21,6 +22,20 @@ class RecurringRule(BaseModel):
     end_date: str | None = None
     category_id: int | None = None
 
+    class Config:
+        from_attributes = True
+
+    @field_validator("frequency", "amount_method", mode="before")
+    @classmethod
+    def _enum_value(cls, v):
+        # Accept the RecurringTemplate enums directly when validating from a model
+        return v.value if isinstance(v, enum.Enum) else v
+
+    @field_validator("start_date", "end_date", mode="before")
+    @classmethod
+    def _iso_date(cls, v):
+        return v.isoformat() if isinstance(v, date) else v
+
 
 class PayeeCreate(BaseModel):
     """Fields for creating a payee."""
@@ -54,5 +69,8 @@ class PayeeResponse(BaseModel):
 
 
 class RematchResponse(BaseModel):
-    """Response from bulk re-match."""
-    updated_count: int
+    """Status of a background re-match job."""
+    job_id: str
+    status: str  # 'queued' | 'running' | 'completed' | 'failed'
+    updated_count: int | None = None
+    error: str | None = None
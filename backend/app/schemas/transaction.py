@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel
 
 from ..models.transaction import TransactionType, TransactionSource
 
@@ -70,12 +70,9 @@ class TransactionResponse(TransactionBase):
     recurring_template_id: int | None = None
     created_at: datetime
     updated_at: datetime
-
-    @computed_field
-    @property
-    def amount(self) -> float:
-        """Amount in dollars."""
-        return self.amount_cents / 100.0
+    # Amount in dollars; read from Transaction.amount, or computed in SQL by
+    # the list endpoint, rather than derived on every serialization
+    amount: float
 
     class Config:
         from_attributes = True
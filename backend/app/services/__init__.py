@@ -10,6 +10,7 @@ from .payee_matcher import (
     rematch_all,
     matches_payee,
     matches_patterns,
+    build_combined_matcher,
     rematch_payee,
 )
 
@@ -25,6 +26,7 @@ __all__ = [
     "rematch_all",
     "matches_payee",
     "matches_patterns",
+    "build_combined_matcher",
     "rematch_payee",
     "generate_forecasts",
     "BudgetService",
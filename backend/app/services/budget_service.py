@@ -1,21 +1,43 @@
 from datetime import date
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import bindparam, delete, extract, func, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
+from sqlalchemy.orm import selectinload
 
 from ..models import Budget, BudgetItem, BudgetAccount, Transaction, TransactionType, Category
 
 
+# Budgets are always rendered with their accounts and items; load both
+# collections up front so listing N budgets is 3 queries, not 2N+1.
+_BUDGET_LOAD_OPTIONS = (
+    selectinload(Budget.accounts),
+    selectinload(Budget.items),
+)
+
+# Cached primary-key lookup (compiled once by lambda_stmt)
+_GET_BUDGET = lambda_stmt(
+    lambda: select(Budget)
+    .options(selectinload(Budget.accounts), selectinload(Budget.items))
+    .where(Budget.id == bindparam("budget_id"))
+)
+
+
 class BudgetService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def list_budgets(self) -> list[Budget]:
-        return self.db.query(Budget).order_by(Budget.name).all()
+    async def stream_budgets(self, chunk_size: int = 500) -> AsyncScalarResult[Budget]:
+        """Stream all budgets, fetched from the cursor in chunks."""
+        return await self.db.stream_scalars(
+            select(Budget)
+            .options(*_BUDGET_LOAD_OPTIONS)
+            .order_by(Budget.name)
+            .execution_options(yield_per=chunk_size)
+        )
 
-    def get_budget(self, budget_id: int) -> Budget | None:
-        return self.db.query(Budget).filter(Budget.id == budget_id).first()
+    async def get_budget(self, budget_id: int) -> Budget | None:
+        return await self.db.scalar(_GET_BUDGET, {"budget_id": budget_id})
 
-    def create_budget(
+    async def create_budget(
         self,
         name: str,
         account_ids: list[int],
@@ -23,7 +45,7 @@ class BudgetService:
     ) -> Budget:
         budget = Budget(name=name)
         self.db.add(budget)
-        self.db.flush()
+        await self.db.flush()
 
         for aid in account_ids:
             self.db.add(BudgetAccount(budget_id=budget.id, account_id=aid))
@@ -35,10 +57,11 @@ class BudgetService:
                 amount_cents=item["amount_cents"],
             ))
 
-        self.db.flush()
+        await self.db.flush()
+        await self._load_collections(budget)
         return budget
 
-    def update_budget(
+    async def update_budget(
         self,
         budget: Budget,
         name: str | None = None,
@@ -53,17 +76,17 @@ class BudgetService:
 
         if account_ids is not None:
             # Full replacement
-            self.db.query(BudgetAccount).filter(
-                BudgetAccount.budget_id == budget.id
-            ).delete()
+            await self.db.execute(
+                delete(BudgetAccount).where(BudgetAccount.budget_id == budget.id)
+            )
             for aid in account_ids:
                 self.db.add(BudgetAccount(budget_id=budget.id, account_id=aid))
 
         if items is not None:
             # Full replacement
-            self.db.query(BudgetItem).filter(
-                BudgetItem.budget_id == budget.id
-            ).delete()
+            await self.db.execute(
+                delete(BudgetItem).where(BudgetItem.budget_id == budget.id)
+            )
             for item in items:
                 self.db.add(BudgetItem(
                     budget_id=budget.id,
@@ -71,15 +94,19 @@ class BudgetService:
                     amount_cents=item["amount_cents"],
                 ))
 
-        self.db.flush()
+        await self.db.flush()
         # Refresh to pick up new relationships
-        self.db.refresh(budget)
+        await self._load_collections(budget)
         return budget
 
-    def delete_budget(self, budget: Budget) -> None:
-        self.db.delete(budget)
+    async def _load_collections(self, budget: Budget) -> None:
+        """(Re)load accounts and items so the budget can be serialized directly."""
+        await self.db.refresh(budget, attribute_names=["accounts", "items"])
+
+    async def delete_budget(self, budget: Budget) -> None:
+        await self.db.delete(budget)
 
-    def auto_populate(
+    async def auto_populate(
         self,
         budget: Budget,
         start_date: date,
@@ -89,15 +116,16 @@ class BudgetService:
         """Replace budget items with historical average spending per category."""
         # Use the budget's own accounts if none specified
         if account_ids is None:
-            account_ids = [ba.account_id for ba in budget.accounts]
+            accounts = await budget.awaitable_attrs.accounts
+            account_ids = [ba.account_id for ba in accounts]
 
         # Query transactions grouped by category
         query = (
-            self.db.query(
+            select(
                 Transaction.category_id,
                 func.sum(Transaction.amount_cents).label("total_cents"),
             )
-            .filter(
+            .where(
                 Transaction.transaction_type.in_([
                     TransactionType.ACTUAL,
                     TransactionType.TRANSFER,
@@ -108,9 +136,9 @@ class BudgetService:
         )
 
         if account_ids:
-            query = query.filter(Transaction.account_id.in_(account_ids))
+            query = query.where(Transaction.account_id.in_(account_ids))
 
-        rows = query.group_by(Transaction.category_id).all()
+        rows = (await self.db.execute(query.group_by(Transaction.category_id))).all()
 
         # Count months in the range
         num_months = (
@@ -132,43 +160,54 @@ class BudgetService:
                 "amount_cents": avg,
             })
 
-        return self.update_budget(budget, items=new_items)
+        return await self.update_budget(budget, items=new_items)
 
-    def budget_vs_actual(
+    async def budget_vs_actual(
         self,
         budget: Budget,
         start_date: date,
         end_date: date,
     ) -> dict:
         """Compare budget targets vs actual spending, broken down by month."""
-        account_ids = [ba.account_id for ba in budget.accounts]
+        account_ids = [ba.account_id for ba in await budget.awaitable_attrs.accounts]
 
         # Build category info map
-        all_categories = self.db.query(Category).all()
+        all_categories = (await self.db.scalars(select(Category))).all()
         cat_map = {c.id: c for c in all_categories}
 
         # Budget items keyed by category_id
-        budget_items = {bi.category_id: bi.amount_cents for bi in budget.items}
+        budget_items = {
+            bi.category_id: bi.amount_cents
+            for bi in await budget.awaitable_attrs.items
+        }
 
         # Find which budget items are on parent categories (for rolling up children)
-        parent_budget_ids = set()
-        for cat_id in budget_items:
-            cat = cat_map.get(cat_id)
-            if cat and cat.parent_id is None:
-                # Check if this parent has children
-                children = [c for c in all_categories if c.parent_id == cat_id]
-                if children:
-                    parent_budget_ids.add(cat_id)
+        parents_with_children = {
+            c.parent_id for c in all_categories if c.parent_id is not None
+        }
+        parent_budget_ids = {
+            cat_id for cat_id in budget_items
+            if cat_id in cat_map
+            and cat_map[cat_id].parent_id is None
+            and cat_id in parents_with_children
+        }
+
+        # Category each actual is reported under: children of a budgeted
+        # parent roll up to it, everything else reports as itself
+        rollup_target = {
+            c.id: c.parent_id if c.parent_id in parent_budget_ids else c.id
+            for c in all_categories
+        }
 
         # Query actual transactions grouped by year, month, category
         query = (
-            self.db.query(
+            select(
                 extract("year", Transaction.posted_date).label("year"),
                 extract("month", Transaction.posted_date).label("month"),
                 Transaction.category_id,
                 func.sum(Transaction.amount_cents).label("actual_cents"),
             )
-            .filter(
+            .where(
                 Transaction.transaction_type.in_([
                     TransactionType.ACTUAL,
                     TransactionType.TRANSFER,
@@ -179,9 +218,11 @@ class BudgetService:
         )
 
         if account_ids:
-            query = query.filter(Transaction.account_id.in_(account_ids))
+            query = query.where(Transaction.account_id.in_(account_ids))
 
-        rows = query.group_by("year", "month", Transaction.category_id).all()
+        rows = (await self.db.execute(
+            query.group_by("year", "month", Transaction.category_id)
+        )).all()
 
         # Organize actuals: {(year, month): {category_id: cents}}
         actuals: dict[tuple[int, int], dict[int | None, int]] = {}
@@ -206,28 +247,22 @@ class BudgetService:
             month_actuals = actuals.get((year, month), {})
 
             # Roll up child actuals to parent if budget is on parent
-            rolled_up: dict[int | None, int] = {}
+            rolled_up: dict[int, int] = {}
             for cat_id, cents in month_actuals.items():
-                if cat_id is not None:
-                    cat = cat_map.get(cat_id)
-                    if cat and cat.parent_id and cat.parent_id in parent_budget_ids:
-                        # Roll up to parent
-                        rolled_up[cat.parent_id] = rolled_up.get(cat.parent_id, 0) + cents
-                        continue
-                rolled_up[cat_id] = rolled_up.get(cat_id, 0) + cents
-
-            # Merge budget items with actuals
-            all_cat_ids = set(budget_items.keys()) | set(rolled_up.keys())
-            items = []
-
-            for cat_id in all_cat_ids:
                 if cat_id is None:
                     continue
+                target = rollup_target.get(cat_id, cat_id)
+                rolled_up[target] = rolled_up.get(target, 0) + cents
+
+            # Merge budget items with actuals, totalling in the same pass
+            items = []
+            total_budget_income = total_actual_income = 0
+            total_budget_expense = total_actual_expense = 0
+
+            for cat_id in budget_items.keys() | rolled_up.keys():
                 budget_cents = budget_items.get(cat_id, 0)
                 actual_cents = rolled_up.get(cat_id, 0)
                 cat = cat_map.get(cat_id)
-                cat_name = cat.name if cat else "Unknown"
-                parent_id = cat.parent_id if cat else None
 
                 # Determine if this is income based on budget sign or actual sign
                 is_income = budget_cents > 0 if budget_cents != 0 else actual_cents > 0
@@ -235,14 +270,18 @@ class BudgetService:
                 # Difference: positive = favorable
                 if is_income:
                     difference = actual_cents - budget_cents
+                    total_budget_income += budget_cents
+                    total_actual_income += actual_cents
                 else:
                     # For expenses (negative), less spending is favorable
                     difference = budget_cents - actual_cents
+                    total_budget_expense += budget_cents
+                    total_actual_expense += actual_cents
 
                 items.append({
                     "category_id": cat_id,
-                    "category_name": cat_name,
-                    "parent_category_id": parent_id,
+                    "category_name": cat.name if cat else "Unknown",
+                    "parent_category_id": cat.parent_id if cat else None,
                     "budget_cents": budget_cents,
                     "actual_cents": actual_cents,
                     "difference_cents": difference,
@@ -252,12 +291,6 @@ class BudgetService:
             # Sort: income first, then expenses
             items.sort(key=lambda x: (not x["is_income"], x["category_name"]))
 
-            # Compute totals
-            total_budget_income = sum(i["budget_cents"] for i in items if i["is_income"])
-            total_actual_income = sum(i["actual_cents"] for i in items if i["is_income"])
-            total_budget_expense = sum(i["budget_cents"] for i in items if not i["is_income"])
-            total_actual_expense = sum(i["actual_cents"] for i in items if not i["is_income"])
-
             result_months.append({
                 "year": year,
                 "month": month,
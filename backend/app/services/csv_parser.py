@@ -12,8 +12,10 @@ import re
 import hashlib
 from datetime import datetime, date
 from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from io import StringIO
-from typing import Any
+from itertools import chain
+from typing import Any, Iterable
 
 
 # Common date formats to try for auto-detection
@@ -104,24 +106,16 @@ class CSVParser:
         """
         Parse CSV content and return structured transactions.
         """
-        lines = content.strip().split('\n')
+        buf = StringIO(content.strip(), newline="")
 
         # Skip initial rows if configured
-        if self.skip_rows > 0:
-            lines = lines[self.skip_rows:]
+        for _ in range(self.skip_rows):
+            buf.readline()
 
-        if not lines:
-            return CSVParseResult(
-                headers=[],
-                header_signature="",
-                transactions=[],
-                errors=["Empty CSV file"]
-            )
-
-        reader = csv.reader(lines, delimiter=self.delimiter)
-        rows = list(reader)
+        reader = csv.reader(buf, delimiter=self.delimiter)
+        first_row = next(reader, None)
 
-        if not rows:
+        if first_row is None:
             return CSVParseResult(
                 headers=[],
                 header_signature="",
@@ -130,18 +124,35 @@ class CSVParser:
             )
 
         if self.has_header:
-            headers = rows[0]
-            data_rows = rows[1:]
+            headers = first_row
+            data_rows = reader
         else:
-            num_cols = len(rows[0])
+            num_cols = len(first_row)
             headers = [f"Column {i + 1}" for i in range(num_cols)]
-            data_rows = rows
+            data_rows = chain([first_row], reader)
+
+        return self.parse_rows(data_rows, headers)
+
+    def parse_rows(
+        self,
+        rows: Iterable[list[str]],
+        headers: list[str]
+    ) -> CSVParseResult:
+        """
+        Parse already-split data rows (everything after the header row).
+
+        Lets callers that have read the header themselves keep going with the
+        same reader instead of parsing the content a second time.
+        """
         header_signature = self._compute_header_signature(headers)
 
         transactions: list[ParsedTransaction] = []
         errors: list[str] = []
+        row_count = 0
 
-        for idx, row in enumerate(data_rows):
+        # Rows are consumed straight off the reader, never held as a list
+        for idx, row in enumerate(rows):
+            row_count += 1
             try:
                 tx = self._parse_row(idx + 1, row, headers)
                 if tx:
@@ -154,16 +165,17 @@ class CSVParser:
             header_signature=header_signature,
             transactions=transactions,
             detected_date_format=self._detected_date_format,
-            row_count=len(data_rows),
+            row_count=row_count,
             error_count=len(errors),
             errors=errors
         )
 
     def _compute_header_signature(self, headers: list[str]) -> str:
         """Compute a stable signature from headers for profile matching."""
-        normalized = [h.strip().lower() for h in headers]
-        signature_str = "|".join(normalized)
-        return hashlib.md5(signature_str.encode()).hexdigest()[:16]
+        # Join on the ASCII unit separator, which real headers don't contain.
+        # blake2b with an 8-byte digest keeps the 16-hex-char signature length.
+        canonical = "\x1f".join(h.strip().lower() for h in headers).encode()
+        return hashlib.blake2b(canonical, digest_size=8).hexdigest()
 
     def _parse_row(
         self,
@@ -308,13 +320,13 @@ class CSVParser:
         # Remove thousand separators (commas)
         amount_str = amount_str.replace(",", "")
 
-        # Parse as float then convert to cents
+        # Parse as Decimal so e.g. "1.005" rounds exactly, not via binary float
         try:
-            amount = float(amount_str)
-            cents = int(round(amount * 100))
-            return -cents if is_negative else cents
-        except ValueError:
+            amount = Decimal(amount_str)
+        except InvalidOperation:
             raise ValueError(f"Could not parse amount: {original}")
+        cents = int((amount * 100).to_integral_value(ROUND_HALF_UP))
+        return -cents if is_negative else cents
 
     def _compute_fingerprint(
         self,
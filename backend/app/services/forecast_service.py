@@ -120,7 +120,7 @@ def generate_forecasts(
     forecasts = []
 
     for template in templates:
-        payee = db.query(Payee).filter(Payee.id == template.payee_id).first()
+        payee = db.get(Payee, template.payee_id)
         if not payee:
             continue
 
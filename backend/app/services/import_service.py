@@ -7,15 +7,35 @@ Handles:
 - Import profile matching and management
 """
 
+import threading
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from dataclasses import dataclass
+from typing import Protocol, Sequence
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, extract
+from sqlalchemy import and_, extract, insert
 
-from ..models import Transaction, ImportProfile, TransactionSource, TransactionType
+from ..database import get_book_generation, on_commit
+from ..models import Transaction, ImportProfile, Payee, TransactionSource, TransactionType
 from .csv_parser import ParsedTransaction, CSVParseResult
-from .payee_matcher import apply_payee_match
+from .payee_matcher import build_combined_matcher
+
+
+class ImportRow(Protocol):
+    """
+    Fields commit_import reads from each row.
+
+    Satisfied by ParsedTransaction and by the ParsedTransactionResponse items
+    of a commit request, which are passed through without conversion.
+    """
+    row_index: int
+    posted_date: date
+    amount_cents: int
+    payee_raw: str | None
+    memo: str | None
+    fingerprint: str
+    external_id: str | None
 
 
 @dataclass
@@ -52,6 +72,11 @@ class ImportResult:
 class ImportService:
     """Service for importing transactions."""
 
+    # (book generation, account_id, header_signature) -> profile id (None = no match).
+    # Shared across instances since a new service is built per request.
+    _profile_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+    _profile_cache_lock = threading.Lock()
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -145,7 +170,7 @@ class ImportService:
         self,
         account_id: int,
         batch_id: str,
-        transactions: list[ParsedTransaction],
+        transactions: Sequence[ImportRow],
         accepted_duplicate_indices: list[int] | None = None,
         source: TransactionSource = TransactionSource.IMPORT_CSV
     ) -> ImportResult:
@@ -160,9 +185,15 @@ class ImportService:
             source: Source of the import (CSV or QFX)
         """
         accepted_dupes = set(accepted_duplicate_indices or [])
-        imported_ids: list[int] = []
+        rows: list[dict] = []
         skipped = 0
 
+        # Compile payee rules once for the batch rather than per row
+        matchers = [
+            (payee, build_combined_matcher(payee.match_patterns))
+            for payee in self.db.query(Payee).all()
+        ]
+
         for tx in transactions:
             # Check if this was a duplicate that wasn't accepted
             if tx.fingerprint and tx.row_index not in accepted_dupes:
@@ -173,23 +204,39 @@ class ImportService:
                     skipped += 1
                     continue
 
-            # Create the transaction
-            db_tx = Transaction(
-                account_id=account_id,
-                posted_date=tx.posted_date,
-                amount_cents=tx.amount_cents,
-                payee_raw=tx.payee_raw,
-                memo=tx.memo,
-                transaction_type=TransactionType.ACTUAL,
-                source=source,
-                import_batch_id=batch_id,
-                external_id=tx.external_id
-            )
-            self.db.add(db_tx)
-            self.db.flush()
-            apply_payee_match(self.db, db_tx)
-            self.db.flush()
-            imported_ids.append(db_tx.id)
+            display_name = None
+            category_id = None
+            if tx.payee_raw:
+                for payee, matcher in matchers:
+                    if matcher(tx.payee_raw):
+                        display_name = payee.name
+                        category_id = payee.default_category_id
+                        break
+
+            rows.append({
+                "account_id": account_id,
+                "posted_date": tx.posted_date,
+                "amount_cents": tx.amount_cents,
+                "payee_raw": tx.payee_raw,
+                "display_name": display_name,
+                "memo": tx.memo,
+                "category_id": category_id,
+                "transaction_type": TransactionType.ACTUAL,
+                "source": source,
+                "import_batch_id": batch_id,
+                "external_id": tx.external_id,
+            })
+
+        # One executemany-style INSERT for the whole batch instead of an ORM
+        # flush per row; ids come back in row order via RETURNING
+        imported_ids: list[int] = []
+        if rows:
+            imported_ids = list(self.db.scalars(
+                insert(Transaction).returning(
+                    Transaction.id, sort_by_parameter_order=True
+                ),
+                rows,
+            ))
 
         return ImportResult(
             batch_id=batch_id,
@@ -198,7 +245,7 @@ class ImportService:
             transaction_ids=imported_ids
         )
 
-    def _find_duplicate(self, account_id: int, tx: ParsedTransaction, exclude_batch_id: str | None = None) -> Transaction | None:
+    def _find_duplicate(self, account_id: int, tx: ImportRow, exclude_batch_id: str | None = None) -> Transaction | None:
         """Find an existing transaction matching this parsed transaction."""
         # Prefer external_id match (FITID) — more reliable than date+amount
         if tx.external_id:
@@ -227,12 +274,32 @@ class ImportService:
         header_signature: str
     ) -> ImportProfile | None:
         """Find an import profile matching the header signature."""
-        return self.db.query(ImportProfile).filter(
+        key = (get_book_generation(), account_id, header_signature)
+        with self._profile_cache_lock:
+            cached = self._profile_cache.get(key, ...)
+        if cached is None:
+            return None
+        if cached is not ...:
+            profile = self.db.get(ImportProfile, cached)
+            if profile is not None and profile.account_id == account_id:
+                return profile
+
+        profile = self.db.query(ImportProfile).filter(
             and_(
                 ImportProfile.account_id == account_id,
                 ImportProfile.header_signature.contains(header_signature)
             )
         ).first()
+        with self._profile_cache_lock:
+            self._profile_cache[key] = profile.id if profile else None
+        return profile
+
+    @classmethod
+    def invalidate_profile_cache(cls, account_id: int) -> None:
+        """Drop cached profile lookups for an account."""
+        with cls._profile_cache_lock:
+            for key in [k for k in cls._profile_cache if k[1] == account_id]:
+                cls._profile_cache.pop(key, None)
 
     def upsert_profile(
         self,
@@ -276,7 +343,7 @@ class ImportService:
             self.db.add(profile)
 
         self.db.flush()
-        self.db.refresh(profile)
+        on_commit(self.db, lambda: self.invalidate_profile_cache(account_id))
         return profile
 
     def get_profiles(self, account_id: int) -> list[ImportProfile]:
@@ -7,6 +7,7 @@ so the existing preview/commit pipeline works unchanged.
 """
 
 import hashlib
+from decimal import Decimal, ROUND_HALF_UP
 from io import BytesIO
 
 from ofxparse import OfxParser
@@ -68,7 +69,9 @@ def parse_ofx_file(content: str) -> CSVParseResult:
     for idx, tx in enumerate(ofx.account.statement.transactions):
         try:
             posted_date = tx.date.date()
-            amount_cents = int(round(float(tx.amount) * 100))
+            amount_cents = int(
+                (Decimal(str(tx.amount)) * 100).to_integral_value(ROUND_HALF_UP)
+            )
 
             payee_raw = (tx.payee or "").strip() or (tx.memo or "").strip() or None
             memo_str = (tx.memo or "").strip() or None
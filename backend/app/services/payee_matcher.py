@@ -6,6 +6,8 @@ and populates display_name on transactions.
 """
 
 import re
+from functools import lru_cache
+from typing import Callable
 from sqlalchemy.orm import Session
 
 from ..models import Payee, Transaction
@@ -21,20 +23,8 @@ def match_payee(db: Session, payee_raw: str) -> str | None:
     if not payee_raw:
         return None
 
-    payees = db.query(Payee).all()
-    raw_lower = payee_raw.lower()
-
-    for payee in payees:
-        for rule in payee.match_patterns or []:
-            match_type = rule.get("type", "contains")
-            pattern = rule.get("pattern", "")
-            if not pattern:
-                continue
-
-            if _matches(raw_lower, pattern, match_type):
-                return payee.name
-
-    return None
+    payee = match_payee_record(db, payee_raw)
+    return payee.name if payee else None
 
 
 def match_payee_record(db: Session, payee_raw: str) -> Payee | None:
@@ -42,54 +32,78 @@ def match_payee_record(db: Session, payee_raw: str) -> Payee | None:
     if not payee_raw:
         return None
 
-    payees = db.query(Payee).all()
-    raw_lower = payee_raw.lower()
+    for payee in db.query(Payee).all():
+        if build_combined_matcher(payee.match_patterns)(payee_raw):
+            return payee
 
-    for payee in payees:
-        for rule in payee.match_patterns or []:
-            match_type = rule.get("type", "contains")
-            pattern = rule.get("pattern", "")
-            if not pattern:
-                continue
+    return None
 
-            if _matches(raw_lower, pattern, match_type):
-                return payee
 
-    return None
+def build_combined_matcher(patterns: list[dict]) -> Callable[[str], bool]:
+    """
+    Compile a list of match patterns into a single predicate.
 
+    Equivalent to testing each pattern in turn, but the patterns are
+    prepared once: exact matches become a set lookup, prefixes
+    a single startswith() over a tuple, and substrings one escaped
+    alternation regex. Use this when testing many payee_raw strings.
 
-def _matches(raw_lower: str, pattern: str, match_type: str) -> bool:
-    """Check if a single pattern matches."""
-    pattern_lower = pattern.lower()
-
-    if match_type == "starts_with":
-        return raw_lower.startswith(pattern_lower)
-    elif match_type == "contains":
-        return pattern_lower in raw_lower
-    elif match_type == "exact":
-        return raw_lower == pattern_lower
-    elif match_type == "regex":
-        try:
-            return bool(re.search(pattern, raw_lower, re.IGNORECASE))
-        except re.error:
-            return False
+    Compiled matchers are cached by pattern content, so repeated calls for
+    an unchanged payee reuse the same predicate.
+    """
+    key = tuple(
+        (rule.get("type", "contains"), rule.get("pattern", ""))
+        for rule in patterns or []
+    )
+    return _compile_matcher(key)
 
-    return False
 
+@lru_cache(maxsize=1024)
+def _compile_matcher(rules: tuple[tuple[str, str], ...]) -> Callable[[str], bool]:
+    exact: set[str] = set()
+    prefixes: list[str] = []
+    substrings: list[str] = []
+    regexes: list[re.Pattern] = []
 
-def matches_patterns(patterns: list[dict], payee_raw: str) -> bool:
-    """Check if any pattern in a list matches a raw payee string."""
-    if not payee_raw:
-        return False
-    raw_lower = payee_raw.lower()
-    for rule in patterns or []:
-        match_type = rule.get("type", "contains")
-        pattern = rule.get("pattern", "")
+    for match_type, pattern in rules:
         if not pattern:
             continue
-        if _matches(raw_lower, pattern, match_type):
+        if match_type == "starts_with":
+            prefixes.append(pattern.lower())
+        elif match_type == "contains":
+            substrings.append(pattern.lower())
+        elif match_type == "exact":
+            exact.add(pattern.lower())
+        elif match_type == "regex":
+            try:
+                regexes.append(re.compile(pattern, re.IGNORECASE))
+            except re.error:
+                continue
+
+    prefix_tuple = tuple(prefixes)
+    contains_re = (
+        re.compile("|".join(re.escape(s) for s in substrings))
+        if substrings else None
+    )
+
+    def matcher(payee_raw: str) -> bool:
+        if not payee_raw:
+            return False
+        raw_lower = payee_raw.lower()
+        if raw_lower in exact:
+            return True
+        if prefix_tuple and raw_lower.startswith(prefix_tuple):
+            return True
+        if contains_re is not None and contains_re.search(raw_lower):
             return True
-    return False
+        return any(r.search(raw_lower) for r in regexes)
+
+    return matcher
+
+
+def matches_patterns(patterns: list[dict], payee_raw: str) -> bool:
+    """Check if any pattern in a list matches a raw payee string."""
+    return build_combined_matcher(patterns)(payee_raw)
 
 
 def matches_payee(payee: Payee, payee_raw: str) -> bool:
@@ -134,14 +148,16 @@ def rematch_all(db: Session) -> int:
         Transaction.payee_raw.isnot(None)
     ).all()
 
+    matchers = [(payee, build_combined_matcher(payee.match_patterns)) for payee in payees]
+
     updated = 0
     for tx in transactions:
         old_name = tx.display_name
         new_name = None
         new_category_id = tx.category_id
 
-        for payee in payees:
-            if matches_payee(payee, tx.payee_raw):
+        for payee, matcher in matchers:
+            if matcher(tx.payee_raw):
                 new_name = payee.name
                 if payee.default_category_id is not None:
                     new_category_id = payee.default_category_id
@@ -167,9 +183,11 @@ def rematch_payee(db: Session, payee: Payee) -> int:
         Transaction.payee_raw.isnot(None)
     ).all()
 
+    matcher = build_combined_matcher(payee.match_patterns)
+
     updated = 0
     for tx in transactions:
-        should_match = matches_payee(payee, tx.payee_raw)
+        should_match = matcher(tx.payee_raw)
         if should_match:
             needs_update = tx.display_name != payee.name
             if payee.default_category_id is not None and tx.category_id != payee.default_category_id:
@@ -1,8 +1,17 @@
-from datetime import date
+from datetime import date, timedelta
 from sqlalchemy.orm import Session, aliased
 from sqlalchemy import func, extract, case
 
-from ..models import Transaction, TransactionType, Category
+from ..models import Transaction, TransactionType, Category, MonthlySummary
+
+
+def _month_aligned(start_date: date | None, end_date: date | None) -> bool:
+    """Whether the range covers whole months, so monthly_summary can answer it."""
+    if start_date and start_date.day != 1:
+        return False
+    if end_date and (end_date + timedelta(days=1)).day != 1:
+        return False
+    return True
 
 
 class ReportService:
@@ -17,37 +26,77 @@ class ReportService:
         category_ids: list[int] | None,
         include_transfers: bool,
     ):
+        """
+        Filtered query over the rows a report aggregates.
+
+        Whole-month ranges read the pre-aggregated monthly_summary; anything
+        else falls back to the transactions table. Returns the query and the
+        entity it selects from, which the _*_column helpers take.
+        """
         if include_transfers:
             allowed_types = [TransactionType.ACTUAL, TransactionType.TRANSFER]
         else:
             allowed_types = [TransactionType.ACTUAL]
 
-        query = self.db.query(Transaction).filter(
-            Transaction.transaction_type.in_(allowed_types)
+        source = MonthlySummary if _month_aligned(start_date, end_date) else Transaction
+        query = self.db.query(source).filter(
+            source.transaction_type.in_(allowed_types)
         )
 
-        if start_date:
-            query = query.filter(Transaction.posted_date >= start_date)
-        if end_date:
-            query = query.filter(Transaction.posted_date <= end_date)
+        if source is MonthlySummary:
+            period = MonthlySummary.year * 12 + MonthlySummary.month
+            if start_date:
+                query = query.filter(period >= start_date.year * 12 + start_date.month)
+            if end_date:
+                query = query.filter(period <= end_date.year * 12 + end_date.month)
+        else:
+            if start_date:
+                query = query.filter(Transaction.posted_date >= start_date)
+            if end_date:
+                query = query.filter(Transaction.posted_date <= end_date)
         if account_ids:
-            query = query.filter(Transaction.account_id.in_(account_ids))
+            query = query.filter(source.account_id.in_(account_ids))
         if category_ids:
-            query = query.filter(Transaction.category_id.in_(category_ids))
+            query = query.filter(source.category_id.in_(category_ids))
 
-        return query
+        return query, source
 
     @staticmethod
-    def _income_expense_columns():
-        income = func.coalesce(
-            func.sum(case((Transaction.amount_cents > 0, Transaction.amount_cents))),
-            0,
-        ).label("income_cents")
-        expense = func.coalesce(
-            func.sum(case((Transaction.amount_cents < 0, -Transaction.amount_cents))),
-            0,
-        ).label("expense_cents")
-        return income, expense
+    def _income_expense_columns(source):
+        if source is MonthlySummary:
+            income = func.coalesce(func.sum(MonthlySummary.income_cents), 0)
+            expense = func.coalesce(func.sum(MonthlySummary.expense_cents), 0)
+        else:
+            income = func.coalesce(
+                func.sum(case((Transaction.amount_cents > 0, Transaction.amount_cents))),
+                0,
+            )
+            expense = func.coalesce(
+                func.sum(case((Transaction.amount_cents < 0, -Transaction.amount_cents))),
+                0,
+            )
+        return income.label("income_cents"), expense.label("expense_cents")
+
+    @staticmethod
+    def _count_column(source):
+        if source is MonthlySummary:
+            count = func.coalesce(func.sum(MonthlySummary.transaction_count), 0)
+        else:
+            count = func.count(Transaction.id)
+        return count.label("transaction_count")
+
+    @staticmethod
+    def _category_column(source):
+        # The summary stores uncategorized rows under category_id 0
+        if source is MonthlySummary:
+            return func.nullif(MonthlySummary.category_id, 0)
+        return Transaction.category_id
+
+    @staticmethod
+    def _category_items(rows) -> list[dict]:
+        # Sums are COALESCEd and counts are integers in SQL, so rows map
+        # straight onto CategorySpendItem fields
+        return [{**row._mapping, "children": None} for row in rows]
 
     def spending_by_category(
         self,
@@ -58,7 +107,7 @@ class ReportService:
         include_transfers: bool,
         group_by_parent: bool = True,
     ):
-        query = self._base_query(
+        query, source = self._base_query(
             start_date=start_date,
             end_date=end_date,
             account_ids=account_ids,
@@ -66,66 +115,47 @@ class ReportService:
             include_transfers=include_transfers,
         )
 
-        income, expense = self._income_expense_columns()
+        income, expense = self._income_expense_columns(source)
 
         if group_by_parent:
             parent_cat = aliased(Category, name="parent_cat")
 
-            group_id = func.coalesce(Category.parent_id, Category.id).label("group_id")
+            group_id = func.coalesce(Category.parent_id, Category.id).label("category_id")
             group_name = func.coalesce(parent_cat.name, Category.name, "Uncategorized").label("category_name")
 
             rows = (
-                query.join(Category, Transaction.category_id == Category.id, isouter=True)
+                query.join(Category, source.category_id == Category.id, isouter=True)
                 .outerjoin(parent_cat, Category.parent_id == parent_cat.id)
                 .with_entities(
                     group_id,
                     group_name,
                     income,
                     expense,
-                    func.count(Transaction.id).label("transaction_count"),
+                    self._count_column(source),
                 )
                 .group_by(group_id, group_name)
                 .order_by(expense.desc())
                 .all()
             )
 
-            return [
-                {
-                    "category_id": row.group_id,
-                    "category_name": row.category_name or "Uncategorized",
-                    "income_cents": int(row.income_cents or 0),
-                    "expense_cents": int(row.expense_cents or 0),
-                    "transaction_count": int(row.transaction_count or 0),
-                    "children": None,
-                }
-                for row in rows
-            ]
+            return self._category_items(rows)
         else:
+            category_col = self._category_column(source)
             rows = (
-                query.join(Category, Transaction.category_id == Category.id, isouter=True)
+                query.join(Category, source.category_id == Category.id, isouter=True)
                 .with_entities(
-                    Transaction.category_id.label("category_id"),
+                    category_col.label("category_id"),
                     func.coalesce(Category.name, "Uncategorized").label("category_name"),
                     income,
                     expense,
-                    func.count(Transaction.id).label("transaction_count"),
+                    self._count_column(source),
                 )
-                .group_by(Transaction.category_id, Category.name)
+                .group_by(category_col, Category.name)
                 .order_by(expense.desc())
                 .all()
             )
 
-            return [
-                {
-                    "category_id": row.category_id,
-                    "category_name": row.category_name,
-                    "income_cents": int(row.income_cents or 0),
-                    "expense_cents": int(row.expense_cents or 0),
-                    "transaction_count": int(row.transaction_count or 0),
-                    "children": None,
-                }
-                for row in rows
-            ]
+            return self._category_items(rows)
 
     def spending_by_category_children(
         self,
@@ -136,7 +166,7 @@ class ReportService:
         include_transfers: bool,
     ):
         """Get child category breakdown for a specific parent category."""
-        query = self._base_query(
+        query, source = self._base_query(
             start_date=start_date,
             end_date=end_date,
             account_ids=account_ids,
@@ -144,7 +174,7 @@ class ReportService:
             include_transfers=include_transfers,
         )
 
-        income, expense = self._income_expense_columns()
+        income, expense = self._income_expense_columns(source)
 
         # Get transactions that belong to the parent or any of its children
         child_ids = (
@@ -154,33 +184,24 @@ class ReportService:
         )
         child_id_list = [c.id for c in child_ids]
         all_ids = [parent_category_id] + child_id_list
+        category_col = self._category_column(source)
 
         rows = (
-            query.filter(Transaction.category_id.in_(all_ids))
-            .join(Category, Transaction.category_id == Category.id, isouter=True)
+            query.filter(source.category_id.in_(all_ids))
+            .join(Category, source.category_id == Category.id, isouter=True)
             .with_entities(
-                Transaction.category_id.label("category_id"),
+                category_col.label("category_id"),
                 func.coalesce(Category.name, "Uncategorized").label("category_name"),
                 income,
                 expense,
-                func.count(Transaction.id).label("transaction_count"),
+                self._count_column(source),
             )
-            .group_by(Transaction.category_id, Category.name)
+            .group_by(category_col, Category.name)
             .order_by(expense.desc())
             .all()
         )
 
-        return [
-            {
-                "category_id": row.category_id,
-                "category_name": row.category_name,
-                "income_cents": int(row.income_cents or 0),
-                "expense_cents": int(row.expense_cents or 0),
-                "transaction_count": int(row.transaction_count or 0),
-                "children": None,
-            }
-            for row in rows
-        ]
+        return self._category_items(rows)
 
     def spending_by_payee(
         self,
@@ -190,7 +211,7 @@ class ReportService:
         category_ids: list[int] | None,
         include_transfers: bool,
     ):
-        query = self._base_query(
+        query, source = self._base_query(
             start_date=start_date,
             end_date=end_date,
             account_ids=account_ids,
@@ -198,28 +219,26 @@ class ReportService:
             include_transfers=include_transfers,
         )
 
-        income, expense = self._income_expense_columns()
+        income, expense = self._income_expense_columns(source)
 
-        payee_label = func.coalesce(
-            Transaction.display_name,
-            Transaction.payee_normalized,
-            Transaction.payee_raw,
-            "Unknown",
-        )
+        if source is MonthlySummary:
+            payee_label = MonthlySummary.payee_label
+        else:
+            payee_label = func.coalesce(Transaction.display_label, "Unknown")
 
         rows = (
             query.with_entities(
                 payee_label.label("payee_name"),
                 income,
                 expense,
-                func.count(Transaction.id).label("transaction_count"),
+                self._count_column(source),
             )
             .group_by(payee_label)
             .order_by(expense.desc())
             .all()
         )
 
-        return rows
+        return [dict(row._mapping) for row in rows]
 
     def spending_trends(
         self,
@@ -229,7 +248,7 @@ class ReportService:
         category_ids: list[int] | None,
         include_transfers: bool,
     ):
-        query = self._base_query(
+        query, source = self._base_query(
             start_date=start_date,
             end_date=end_date,
             account_ids=account_ids,
@@ -237,10 +256,13 @@ class ReportService:
             include_transfers=include_transfers,
         )
 
-        income, expense = self._income_expense_columns()
+        income, expense = self._income_expense_columns(source)
 
-        year_col = extract("year", Transaction.posted_date)
-        month_col = extract("month", Transaction.posted_date)
+        if source is MonthlySummary:
+            year_col, month_col = MonthlySummary.year, MonthlySummary.month
+        else:
+            year_col = extract("year", Transaction.posted_date)
+            month_col = extract("month", Transaction.posted_date)
 
         rows = (
             query.with_entities(
@@ -254,4 +276,4 @@ class ReportService:
             .all()
         )
 
-        return rows
+        return [dict(row._mapping) for row in rows]
@@ -57,12 +57,33 @@ export function useDeletePayee() {
   })
 }
 
+interface RematchJob {
+  job_id: string
+  status: 'queued' | 'running' | 'completed' | 'failed'
+  updated_count: number | null
+  error: string | null
+}
+
+const REMATCH_POLL_MS = 500
+
+// Re-matches run as background jobs; queue one and poll until it finishes
+async function runRematchJob(endpoint: string): Promise<{ updated_count: number }> {
+  let job = await api.post<RematchJob>(endpoint)
+  while (job.status === 'queued' || job.status === 'running') {
+    await new Promise((resolve) => setTimeout(resolve, REMATCH_POLL_MS))
+    job = await api.get<RematchJob>(`/payees/rematch/status/${job.job_id}`)
+  }
+  if (job.status === 'failed') {
+    throw new Error(job.error || 'Re-match failed')
+  }
+  return { updated_count: job.updated_count ?? 0 }
+}
+
 export function useRematchPayees() {
   const queryClient = useQueryClient()
 
   return useMutation({
-    mutationFn: () =>
-      api.post<{ updated_count: number }>('/payees/rematch'),
+    mutationFn: () => runRematchJob('/payees/rematch'),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['payees'] })
       queryClient.invalidateQueries({ queryKey: ['transactions'] })
@@ -74,8 +95,7 @@ export function useRematchPayee() {
   const queryClient = useQueryClient()
 
   return useMutation({
-    mutationFn: (payeeId: number) =>
-      api.post<{ updated_count: number }>(`/payees/${payeeId}/rematch`),
+    mutationFn: (payeeId: number) => runRematchJob(`/payees/${payeeId}/rematch`),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['payees'] })
       queryClient.invalidateQueries({ queryKey: ['transactions'] })